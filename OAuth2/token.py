@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 
@@ -11,7 +12,8 @@ class OAuth2Token:
     def __init__(self, token_data: Token) -> None:
         self._token_data: Token = token_data
         self._access_token: str = token_data["access_token"]
-        self._token_type: str = token_data.get("token_type", "Bearer")
+        # the token type is almost always "Bearer" and is formatted into every auth header
+        self._token_type: str = sys.intern(token_data.get("token_type") or "Bearer")
         self._refresh_token: Optional[str] = token_data.get("refresh_token")
         self._expires_at: Optional[datetime] = None
         
@@ -299,6 +299,13 @@ class Client:
     
         .. versionadded:: Nexon 0.2.1
 
+    cache_edited_role: :class:`bool`
+        Whether :meth:`Role.edit` should update the edited role in place and
+        return it instead of creating a new :class:`Role`.
+        Defaults to ``False``
+
+        .. versionadded:: Nexon 0.3.2
+
     Attributes
     ----------
     ws
@@ -337,7 +344,8 @@ class Client:
         default_guild_ids: Optional[List[int]] = None,
         enable_logger_console: bool = True,
         logger_level: int = logging.INFO,
-        enable_user_data : bool = False
+        enable_user_data : bool = False,
+        cache_edited_role: bool = False,
     ) -> None:
         # self.ws is set in the connect method
         self.ws: DiscordWebSocket = None  # type: ignore
@@ -380,6 +388,7 @@ class Client:
         )
 
         self._connection.shard_count = self.shard_count
+        self._connection.cache_edited_role = cache_edited_role
         self._closed: bool = False
         self._ready: asyncio.Event = asyncio.Event()
         self._connection._get_websocket = self._get_websocket
@@ -73,6 +73,55 @@ def set_json_decoder(obj):
     return obj
 
 
+def _restore_sets(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return set_json_decoder({key: _restore_sets(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return [_restore_sets(value) for value in obj]
+    return obj
+
+
+_set_json_encoder = SetJSONEncoder()
+
+try:
+    import orjson
+except ModuleNotFoundError:
+
+    def _encode_set_json(obj: Any) -> str:
+        return _set_json_encoder.encode(obj)
+
+    def _decode_set_json(data: Union[str, bytes]) -> Any:
+        return json.loads(data, object_hook=set_json_decoder)
+
+else:
+
+    def _set_json_default(obj: Any) -> Any:
+        if isinstance(obj, set):
+            return {"__type__": "set", "items": list(obj)}
+        raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+    # orjson writes compact, non ASCII-escaped JSON; both forms decode the same way.
+    # It can't represent integers wider than 64 bits: it refuses to encode them and
+    # decodes them as floats, so anything that may hold one takes the json module path
+    # (19 digit snowflakes still fit and stay on orjson).
+    _LONG_DIGITS_STR = re.compile(r"-\d{19}|\d{20}")
+    _LONG_DIGITS_BYTES = re.compile(rb"-\d{19}|\d{20}")
+
+    def _encode_set_json(obj: Any) -> str:
+        try:
+            return orjson.dumps(
+                obj, default=_set_json_default, option=orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            return _set_json_encoder.encode(obj)
+
+    def _decode_set_json(data: Union[str, bytes]) -> Any:
+        long_digits = _LONG_DIGITS_STR if isinstance(data, str) else _LONG_DIGITS_BYTES
+        if long_digits.search(data) is not None:
+            return json.loads(data, object_hook=set_json_decoder)
+        return _restore_sets(orjson.loads(data))
+
+
 class BotUser(Model):
     """Bot-wide statistics and settings tracker.
 
@@ -202,11 +251,11 @@ class UserData(Model):
     last_message = fields.DatetimeField(null=True)
 
     # JSON fields with proper encoder/decoder
-    unique_names: Set[str] = fields.JSONField(default=lambda: {"__type__": "set", "items": []}, encoder=SetJSONEncoder().encode, decoder=lambda s: json.loads(s, object_hook=set_json_decoder))  # type: ignore
-    unique_users_mentioned: Set[int] = fields.JSONField(default=lambda: {"__type__": "set", "items": []}, encoder=SetJSONEncoder().encode, decoder=lambda s: json.loads(s, object_hook=set_json_decoder))  # type: ignore
-    unique_emojis_used: Set[str] = fields.JSONField(default=lambda: {"__type__": "set", "items": []}, encoder=SetJSONEncoder().encode, decoder=lambda s: json.loads(s, object_hook=set_json_decoder))  # type: ignore
-    unique_custom_emojis_used: Set[str] = fields.JSONField(default=lambda: {"__type__": "set", "items": []}, encoder=SetJSONEncoder().encode, decoder=lambda s: json.loads(s, object_hook=set_json_decoder))  # type: ignore
-    unique_domains: Set[str] = fields.JSONField(default=lambda: {"__type__": "set", "items": []}, encoder=SetJSONEncoder().encode, decoder=lambda s: json.loads(s, object_hook=set_json_decoder))  # type: ignore
+    unique_names: Set[str] = fields.JSONField(default=lambda: {"__type__": "set", "items": []}, encoder=_encode_set_json, decoder=_decode_set_json)  # type: ignore
+    unique_users_mentioned: Set[int] = fields.JSONField(default=lambda: {"__type__": "set", "items": []}, encoder=_encode_set_json, decoder=_decode_set_json)  # type: ignore
+    unique_emojis_used: Set[str] = fields.JSONField(default=lambda: {"__type__": "set", "items": []}, encoder=_encode_set_json, decoder=_decode_set_json)  # type: ignore
+    unique_custom_emojis_used: Set[str] = fields.JSONField(default=lambda: {"__type__": "set", "items": []}, encoder=_encode_set_json, decoder=_decode_set_json)  # type: ignore
+    unique_domains: Set[str] = fields.JSONField(default=lambda: {"__type__": "set", "items": []}, encoder=_encode_set_json, decoder=_decode_set_json)  # type: ignore
     favorites_commands: Dict[str, int] = fields.JSONField(default=dict)  # type: ignore
     preferred_channels: Dict[str, int] = fields.JSONField(default=dict)  # type: ignore
     last_command_use: Dict[str, float] = fields.JSONField(default=dict, null=True)  # type: ignore
@@ -555,11 +604,11 @@ class MemberData(Model):
     last_message = fields.DatetimeField(null=True)
 
     # JSON fields with proper encoder/decoder
-    unique_names: Set[str] = fields.JSONField(default=lambda: {"__type__": "set", "items": []}, encoder=SetJSONEncoder().encode, decoder=lambda s: json.loads(s, object_hook=set_json_decoder))  # type: ignore
-    unique_users_mentioned: Set[int] = fields.JSONField(default=lambda: {"__type__": "set", "items": []}, encoder=SetJSONEncoder().encode, decoder=lambda s: json.loads(s, object_hook=set_json_decoder))  # type: ignore
-    unique_emojis_used: Set[str] = fields.JSONField(default=lambda: {"__type__": "set", "items": []}, encoder=SetJSONEncoder().encode, decoder=lambda s: json.loads(s, object_hook=set_json_decoder))  # type: ignore
-    unique_custom_emojis_used: Set[str] = fields.JSONField(default=lambda: {"__type__": "set", "items": []}, encoder=SetJSONEncoder().encode, decoder=lambda s: json.loads(s, object_hook=set_json_decoder))  # type: ignore
-    unique_domains: Set[str] = fields.JSONField(default=lambda: {"__type__": "set", "items": []}, encoder=SetJSONEncoder().encode, decoder=lambda s: json.loads(s, object_hook=set_json_decoder))  # type: ignore
+    unique_names: Set[str] = fields.JSONField(default=lambda: {"__type__": "set", "items": []}, encoder=_encode_set_json, decoder=_decode_set_json)  # type: ignore
+    unique_users_mentioned: Set[int] = fields.JSONField(default=lambda: {"__type__": "set", "items": []}, encoder=_encode_set_json, decoder=_decode_set_json)  # type: ignore
+    unique_emojis_used: Set[str] = fields.JSONField(default=lambda: {"__type__": "set", "items": []}, encoder=_encode_set_json, decoder=_decode_set_json)  # type: ignore
+    unique_custom_emojis_used: Set[str] = fields.JSONField(default=lambda: {"__type__": "set", "items": []}, encoder=_encode_set_json, decoder=_decode_set_json)  # type: ignore
+    unique_domains: Set[str] = fields.JSONField(default=lambda: {"__type__": "set", "items": []}, encoder=_encode_set_json, decoder=_decode_set_json)  # type: ignore
     favorites_commands: Dict[str, int] = fields.JSONField(default=dict)  # type: ignore
     preferred_channels: Dict[str, int] = fields.JSONField(default=dict)  # type: ignore
     last_command_use: Dict[str, float] = fields.JSONField(default=dict, null=True)  # type: ignore
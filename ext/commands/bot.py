@@ -1454,6 +1454,13 @@ class Bot(BotBase, nexon.Client):
         Defaults to ``False``
     
         .. versionadded:: Nexon 0.2.2
+
+    cache_edited_role: :class:`bool`
+        Whether :meth:`Role.edit` should update the edited role in place and
+        return it instead of creating a new :class:`Role`.
+        Defaults to ``False``
+
+        .. versionadded:: Nexon 0.3.2
     """
 
     def __init__(
@@ -1500,6 +1507,7 @@ class Bot(BotBase, nexon.Client):
         enable_logger_console: bool = True,
         logger_level: int = logging.INFO,
         enable_user_data: bool = False,
+        cache_edited_role: bool = False,
     ) -> None:
         nexon.Client.__init__(
             self,
@@ -1530,8 +1538,8 @@ class Bot(BotBase, nexon.Client):
             default_guild_ids=default_guild_ids,
             enable_logger_console=enable_logger_console,
             logger_level=logger_level,
-            enable_user_data=enable_user_data
-,
+            enable_user_data=enable_user_data,
+            cache_edited_role=cache_edited_role,
         )
 
         BotBase.__init__(
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import copy
 import unicodedata
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
 import warnings
 from asyncio import Future
 from typing import (
@@ -13,6 +15,7 @@ from typing import (
     Callable,
     ClassVar,
     Dict,
+    Iterable,
     List,
     NamedTuple,
     Optional,
@@ -289,11 +292,14 @@ class Guild(Hashable):
         "nsfw_level",
         "_application_commands",
         "_members",
+        "_role_member_index",
         "_channels",
         "_icon",
         "_banner",
         "_state",
         "_roles",
+        "_roles_sorted_by_pos",
+        "_role_positions",
         "_member_count",
         "_large",
         "_splash",
@@ -324,6 +330,11 @@ class Guild(Hashable):
     def __init__(self, *, data: GuildPayload, state: ConnectionState) -> None:
         self._channels: Dict[int, GuildChannel] = {}
         self._members: Dict[int, Member] = {}
+        # built lazily on the first Role.members lookup
+        self._role_member_index: Optional[Dict[int, Set[int]]] = None
+        # rebuilt lazily whenever a role is added, removed or moved
+        self._roles_sorted_by_pos: Optional[List[Role]] = None
+        self._role_positions: List[int] = []
         self._scheduled_events: Dict[int, ScheduledEvent] = {}
         self._voice_states: Dict[int, VoiceState] = {}
         self._threads: Dict[int, Thread] = {}
@@ -341,7 +352,12 @@ class Guild(Hashable):
         return self._voice_states.get(user_id)
 
     def _add_member(self, member: Member, /) -> None:
+        previous = self._members.get(member.id)
         self._members[member.id] = member
+        if self._role_member_index is not None:
+            if previous is not None:
+                self._unindex_member_roles(previous.id, previous._roles)
+            self._index_member_roles(member.id, member._roles)
 
     def _store_thread(self, payload: ThreadPayload, /) -> Thread:
         thread = Thread(guild=self, state=self._state, data=payload)
@@ -349,7 +365,42 @@ class Guild(Hashable):
         return thread
 
     def _remove_member(self, member: Snowflake, /) -> None:
-        self._members.pop(member.id, None)
+        removed = self._members.pop(member.id, None)
+        if removed is not None and self._role_member_index is not None:
+            self._unindex_member_roles(removed.id, removed._roles)
+
+    def _index_member_roles(self, member_id: int, role_ids: Iterable[int], /) -> None:
+        index = self._role_member_index
+        for role_id in role_ids:
+            try:
+                index[role_id].add(member_id)  # type: ignore
+            except KeyError:
+                index[role_id] = {member_id}  # type: ignore
+
+    def _unindex_member_roles(self, member_id: int, role_ids: Iterable[int], /) -> None:
+        index = self._role_member_index
+        for role_id in role_ids:
+            holders = index.get(role_id)  # type: ignore
+            if holders is not None:
+                holders.discard(member_id)
+
+    def _update_member_roles(self, member: Member, before: Iterable[int], /) -> None:
+        # only cached members are tracked in the index
+        if self._role_member_index is None or self._members.get(member.id) is not member:
+            return
+
+        old_roles = set(before)
+        new_roles = set(member._roles)
+        self._unindex_member_roles(member.id, old_roles - new_roles)
+        self._index_member_roles(member.id, new_roles - old_roles)
+
+    def _get_role_member_ids(self, role_id: int, /) -> Set[int]:
+        index = self._role_member_index
+        if index is None:
+            index = self._role_member_index = {}
+            for member in self._members.values():
+                self._index_member_roles(member.id, member._roles)
+        return index.get(role_id, set())
 
     def _add_thread(self, thread: Thread, /) -> None:
         self._threads[thread.id] = thread
@@ -434,19 +485,35 @@ class Guild(Hashable):
             r.position += not r.is_default()
 
         self._roles[role.id] = role
+        self._roles_sorted_by_pos = None
 
     def _remove_role(self, role_id: int, /) -> Role:
         # this raises KeyError if it fails..
         role = self._roles.pop(role_id)
 
+        if self._role_member_index is not None:
+            self._role_member_index.pop(role_id, None)
+
         # since it didn't, we can change the positions now
         # basically the same as above except we only decrement
         # the position if we're above the role we deleted.
         for r in self._roles.values():
             r.position -= r.position > role.position
 
+        self._roles_sorted_by_pos = None
         return role
 
+    def _roles_in_position_range(self, low: int, high: int, /) -> List[Role]:
+        roles = self._roles_sorted_by_pos
+        if roles is None:
+            roles = self._roles_sorted_by_pos = sorted(
+                self._roles.values(), key=attrgetter("_sort_key")
+            )
+            self._role_positions = [r.position for r in roles]
+
+        positions = self._role_positions
+        return roles[bisect_left(positions, low) : bisect_right(positions, high)]
+
     def _from_data(self, guild: GuildPayload) -> None:
         # according to Stan, this is always available even if the guild is unavailable
         # I don't have this guarantee when someone updates the guild.
@@ -909,7 +976,7 @@ class Guild(Hashable):
         The first element of this list will be the lowest role in the
         hierarchy.
         """
-        return sorted(self._roles.values())
+        return sorted(self._roles.values(), key=attrgetter("_sort_key"))
 
     def get_role(self, role_id: int, /) -> Optional[Role]:
         """Returns a role with the given ID.
@@ -42,7 +42,7 @@ from .object import Object
 from .permissions import Permissions
 from .user import ClientUser, User
 from .utils import snowflake_time
-from .webhook.async_ import Webhook, WebhookMessage, async_context, handle_message_parameters
+from .webhook.async_ import Webhook, WebhookMessage, _get_adapter, handle_message_parameters
 
 __all__ = (
     "Interaction",
@@ -383,7 +383,7 @@ class Interaction(Hashable, Generic[ClientT]):
         if channel is None:
             raise ClientException("Channel for message could not be resolved")
 
-        adapter = async_context.get()
+        adapter = _get_adapter()
         data = await adapter.get_original_interaction_response(
             application_id=self.application_id,
             token=self.token,
@@ -474,7 +474,7 @@ class Interaction(Hashable, Generic[ClientT]):
             allowed_mentions=allowed_mentions,
             previous_allowed_mentions=previous_mentions,
         )
-        adapter = async_context.get()
+        adapter = _get_adapter()
         data = await adapter.edit_original_interaction_response(
             self.application_id,
             self.token,
@@ -516,7 +516,7 @@ class Interaction(Hashable, Generic[ClientT]):
         Forbidden
             Deleted a message that is not yours.
         """
-        adapter = async_context.get()
+        adapter = _get_adapter()
         delete_func = adapter.delete_original_interaction_response(
             self.application_id,
             self.token,
@@ -723,7 +723,7 @@ class InteractionResponse:
             defer_type = InteractionResponseType.deferred_message_update.value
 
         if defer_type:
-            adapter = async_context.get()
+            adapter = _get_adapter()
             await adapter.create_interaction_response(
                 parent.id, parent.token, session=parent._session, type=defer_type, data=data
             )
@@ -748,7 +748,7 @@ class InteractionResponse:
 
         parent = self._parent
         if parent.type is InteractionType.ping:
-            adapter = async_context.get()
+            adapter = _get_adapter()
             await adapter.create_interaction_response(
                 parent.id,
                 parent.token,
@@ -787,7 +787,7 @@ class InteractionResponse:
 
         payload = {"choices": choice_list}
 
-        adapter = async_context.get()
+        adapter = _get_adapter()
         await adapter.create_interaction_response(
             self._parent.id,
             self._parent.token,
@@ -938,7 +938,7 @@ class InteractionResponse:
             payload["allowed_mentions"] = allowed_mentions.to_dict()
 
         parent = self._parent
-        adapter = async_context.get()
+        adapter = _get_adapter()
         try:
             await adapter.create_interaction_response(
                 parent.id,
@@ -988,7 +988,7 @@ class InteractionResponse:
             raise InteractionResponded(self._parent)
 
         parent = self._parent
-        adapter = async_context.get()
+        adapter = _get_adapter()
         await adapter.create_interaction_response(
             parent.id,
             parent.token,
@@ -1105,7 +1105,7 @@ class InteractionResponse:
             else:
                 payload["components"] = view.to_components()
 
-        adapter = async_context.get()
+        adapter = _get_adapter()
         try:
             await adapter.create_interaction_response(
                 parent.id,
@@ -319,7 +319,9 @@ class Member(abc.Messageable, _UserTag):
     def _update_from_message(self, data: MemberPayload) -> None:
         self.joined_at = utils.parse_time(data.get("joined_at"))
         self.premium_since = utils.parse_time(data.get("premium_since"))
+        before = self._roles
         self._roles = utils.SnowflakeList(map(int, data["roles"]))
+        self.guild._update_member_roles(self, before)
         self.nick = data.get("nick", None)
         self.pending = data.get("pending", False)
         self._timeout = utils.parse_time(data.get("communication_disabled_until"))
@@ -374,7 +376,9 @@ class Member(abc.Messageable, _UserTag):
             self.pending = data["pending"]
 
         self.premium_since = utils.parse_time(data.get("premium_since"))
+        before = self._roles
         self._roles = utils.SnowflakeList(map(int, data["roles"]))
+        self.guild._update_member_roles(self, before)
         self._avatar = data.get("avatar")
         self._timeout = utils.parse_time(data.get("communication_disabled_until"))
         self._flags = data.get("flags", 0)
@@ -493,7 +497,7 @@ class Member(abc.Messageable, _UserTag):
             if role:
                 result.append(role)
         result.append(g.default_role)
-        result.sort()
+        result.sort(key=attrgetter("_sort_key"))
         return result
 
     @property
@@ -623,7 +627,10 @@ class Member(abc.Messageable, _UserTag):
         if len(self._roles) == 0:
             return guild.default_role
 
-        return max(guild.get_role(rid) or guild.default_role for rid in self._roles)
+        return max(
+            (guild.get_role(rid) or guild.default_role for rid in self._roles),
+            key=attrgetter("_sort_key"),
+        )
 
     @property
     def guild_permissions(self) -> Permissions:
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+import sys
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from .asset import Asset
 from .colour import Colour
@@ -191,8 +192,6 @@ class Role(Hashable):
         integrations such as Twitch.
     mentionable: :class:`bool`
         Indicates if the role can be mentioned by users.
-    tags: Optional[:class:`RoleTags`]
-        The role tags associated with this role.
     """
 
     __slots__ = (
@@ -200,21 +199,24 @@ class Role(Hashable):
         "name",
         "_permissions",
         "_colour",
-        "position",
+        "_position",
+        "_sort_key",
         "managed",
         "mentionable",
         "hoist",
         "guild",
-        "tags",
+        "_tags_data",
         "_icon",
         "_state",
         "_flags",
+        "_mention",
     )
 
     def __init__(self, *, guild: Guild, state: ConnectionState, data: RolePayload) -> None:
         self.guild: Guild = guild
         self._state: ConnectionState = state
         self.id: int = int(data["id"])
+        self._mention: str = "@everyone" if self.id == guild.id else f"<@&{self.id}>"
         self._update(data)
 
     def __str__(self) -> str:
@@ -224,25 +226,21 @@ class Role(Hashable):
         return f"<Role id={self.id} name={self.name!r}>"
 
     def __lt__(self, other: Self) -> bool:
-        if not isinstance(other, Role) or not isinstance(self, Role):
+        if not isinstance(other, Role):
             return NotImplemented
 
-        if self.guild != other.guild:
+        guild_id = self.guild.id
+        if guild_id != other.guild.id:
             raise RuntimeError("Cannot compare roles from two different guilds.")
 
         # the @everyone role is always the lowest role in hierarchy
-        guild_id = self.guild.id
         if self.id == guild_id:
             # everyone_role < everyone_role -> False
             return other.id != guild_id
+        if other.id == guild_id:
+            return False
 
-        if self.position < other.position:
-            return True
-
-        if self.position == other.position:
-            return int(self.id) > int(other.id)
-
-        return False
+        return self._sort_key < other._sort_key
 
     def __le__(self, other: Self) -> bool:
         r = Role.__lt__(other, self)
@@ -260,21 +258,35 @@ class Role(Hashable):
         return not r
 
     def _update(self, data: RolePayload) -> None:
-        self.name: str = data["name"]
+        # many guilds share the same role names, e.g. level roles
+        self.name: str = sys.intern(data["name"])
         self._permissions: int = int(data.get("permissions", 0))
-        self.position: int = data.get("position", 0)
+        self.position = data.get("position", 0)
         self._colour: int = data.get("color", 0)
         self.hoist: bool = data.get("hoist", False)
         self.managed: bool = data.get("managed", False)
         self.mentionable: bool = data.get("mentionable", False)
-        self._icon: Optional[str] = data.get("icon", None)
-        if self._icon is None:
-            self._icon: Optional[str] = data.get("unicode_emoji", None)
-        self.tags: Optional[RoleTags]
-        self.tags = RoleTags(data["tags"]) if "tags" in data else None
+        unicode_emoji = data.get("unicode_emoji")
+        self._icon: Optional[str] = data.get("icon") or (
+            unicode_emoji and sys.intern(unicode_emoji)
+        )
+        # RoleTags is only built when the tags are first accessed
+        self._tags_data: Optional[Union[RoleTagPayload, RoleTags]] = data.get("tags")
 
         self._flags: int = data.get("flags", 0)
 
+    @property
+    def position(self) -> int:
+        return self._position
+
+    @position.setter
+    def position(self, value: int) -> None:
+        self._position = value
+        # roles on the same position are ordered by descending ID,
+        # the @everyone role always sorts first
+        self._sort_key: Tuple[int, int] = (-1, 0) if self.is_default() else (value, -self.id)
+        self.guild._roles_sorted_by_pos = None
+
     def is_default(self) -> bool:
         """:class:`bool`: Checks if the role is the default role."""
         return self.guild.id == self.id
@@ -284,21 +296,24 @@ class Role(Hashable):
 
         .. versionadded:: 1.6
         """
-        return self.tags is not None and self.tags.is_bot_managed()
+        tags = self.tags
+        return tags is not None and tags.is_bot_managed()
 
     def is_premium_subscriber(self) -> bool:
         """:class:`bool`: Whether the role is the premium subscriber, AKA "boost", role for the guild.
 
         .. versionadded:: 1.6
         """
-        return self.tags is not None and self.tags.is_premium_subscriber()
+        tags = self.tags
+        return tags is not None and tags.is_premium_subscriber()
 
     def is_integration(self) -> bool:
         """:class:`bool`: Whether the role is managed by an integration.
 
         .. versionadded:: 1.6
         """
-        return self.tags is not None and self.tags.is_integration()
+        tags = self.tags
+        return tags is not None and tags.is_integration()
 
     def is_assignable(self) -> bool:
         """:class:`bool`: Whether the role is able to be assigned or removed by the bot.
@@ -319,6 +334,16 @@ class Role(Hashable):
         """
         return self.flags.in_prompt
 
+    @property
+    def tags(self) -> Optional[RoleTags]:
+        """Optional[:class:`RoleTags`]: The role tags associated with this role."""
+        tags = self._tags_data
+        if tags is None or isinstance(tags, RoleTags):
+            return tags
+
+        self._tags_data = tags = RoleTags(tags)
+        return tags
+
     @property
     def permissions(self) -> Permissions:
         """:class:`Permissions`: Returns the role's permissions."""
@@ -342,19 +367,22 @@ class Role(Hashable):
     @property
     def mention(self) -> str:
         """:class:`str`: Returns a string that allows you to mention a role."""
-        if self.id != self.guild.id:
-            return f"<@&{self.id}>"
-        return "@everyone"
+        return self._mention
 
     @property
     def members(self) -> List[Member]:
         """List[:class:`Member`]: Returns all the members with this role."""
-        all_members = self.guild.members
         if self.is_default():
-            return all_members
+            return self.guild.members
 
-        role_id = self.id
-        return [member for member in all_members if member._roles.has(role_id)]
+        guild = self.guild
+        member_ids = guild._get_role_member_ids(self.id)
+        if not member_ids:
+            return []
+
+        # walk the member cache so the result keeps guild member order, the index
+        # only replaces the per member role check and stale ids are never looked up
+        return [member for member_id, member in guild._members.items() if member_id in member_ids]
 
     @property
     def icon(self) -> Optional[Union[Asset, str]]:
@@ -378,9 +406,13 @@ class Role(Hashable):
 
         http = self._state.http
 
-        change_range = range(min(self.position, position), max(self.position, position) + 1)
+        low = min(self.position, position)
+        high = max(self.position, position)
+        change_range = range(low, high + 1)
         roles = [
-            r.id for r in self.guild.roles[1:] if r.position in change_range and r.id != self.id
+            r.id
+            for r in self.guild._roles_in_position_range(low, high)
+            if not r.is_default() and r.id != self.id
         ]
 
         if self.position > position:
@@ -424,6 +456,14 @@ class Role(Hashable):
         .. versionchanged:: 2.1
             The ``icon`` parameter now accepts :class:`Attachment`, and :class:`Asset`.
 
+        .. note::
+
+            If the client was created with ``cache_edited_role=True``, this role
+            is updated in place and returned instead of a new :class:`Role`.
+            Otherwise the returned role is not written back to the cache; this
+            role and the guild's cached copy only change once Discord sends the
+            role update event.
+
         Parameters
         ----------
         name: :class:`str`
@@ -491,6 +531,10 @@ class Role(Hashable):
                 payload["icon"] = await obj_to_base64_data(icon)
 
         data = await self._state.http.edit_role(self.guild.id, self.id, reason=reason, **payload)
+        if self._state.cache_edited_role:
+            self._update(data)
+            return self
+
         return Role(guild=self.guild, data=data, state=self._state)
 
     async def delete(self, *, reason: Optional[str] = None) -> None:
@@ -188,6 +188,8 @@ class ConnectionState:
             raise TypeError("allowed_mentions parameter must be AllowedMentions")
 
         self.allowed_mentions: Optional[AllowedMentions] = allowed_mentions
+        # when set, Role.edit updates the role in place instead of creating a new one
+        self.cache_edited_role: bool = False
         self._chunk_requests: Dict[Union[int, str], ChunkRequest] = {}
         self._chunk_tasks: Dict[Union[int, str], asyncio.Task[None]] = {}
         self._background_tasks: Set[asyncio.Task] = set()
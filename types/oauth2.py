@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from typing import TypedDict, List, Optional
 from typing_extensions import NotRequired
 
@@ -56,31 +57,31 @@ class GuildMember(TypedDict):
 # OAuth2 Scopes
 class OAuth2Scope:
     """OAuth2 scopes that can be requested"""
-    ACTIVITIES_READ = "activities.read"
-    ACTIVITIES_WRITE = "activities.write"
-    APPLICATIONS_BUILDS_READ = "applications.builds.read"
-    APPLICATIONS_BUILDS_UPLOAD = "applications.builds.upload"
-    APPLICATIONS_COMMANDS = "applications.commands"
-    APPLICATIONS_COMMANDS_UPDATE = "applications.commands.update"
-    APPLICATIONS_COMMANDS_PERMISSIONS_UPDATE = "applications.commands.permissions.update"
-    APPLICATIONS_ENTITLEMENTS = "applications.entitlements"
-    APPLICATIONS_STORE_UPDATE = "applications.store.update"
-    BOT = "bot"
-    CONNECTIONS = "connections"
-    DM_CHANNELS_READ = "dm_channels.read"
-    EMAIL = "email"
-    GDM_JOIN = "gdm.join"
-    GUILDS = "guilds"
-    GUILDS_JOIN = "guilds.join"
-    GUILDS_MEMBERS_READ = "guilds.members.read"
-    IDENTIFY = "identify"
-    MESSAGES_READ = "messages.read"
-    RELATIONSHIPS_READ = "relationships.read"
-    ROLE_CONNECTIONS_WRITE = "role_connections.write"
-    RPC = "rpc"
-    RPC_ACTIVITIES_WRITE = "rpc.activities.write"
-    RPC_NOTIFICATIONS_READ = "rpc.notifications.read"
-    RPC_VOICE_READ = "rpc.voice.read"
-    RPC_VOICE_WRITE = "rpc.voice.write"
-    VOICE = "voice"
-    WEBHOOK_INCOMING = "webhook.incoming"
\ No newline at end of file
+    ACTIVITIES_READ = sys.intern("activities.read")
+    ACTIVITIES_WRITE = sys.intern("activities.write")
+    APPLICATIONS_BUILDS_READ = sys.intern("applications.builds.read")
+    APPLICATIONS_BUILDS_UPLOAD = sys.intern("applications.builds.upload")
+    APPLICATIONS_COMMANDS = sys.intern("applications.commands")
+    APPLICATIONS_COMMANDS_UPDATE = sys.intern("applications.commands.update")
+    APPLICATIONS_COMMANDS_PERMISSIONS_UPDATE = sys.intern("applications.commands.permissions.update")
+    APPLICATIONS_ENTITLEMENTS = sys.intern("applications.entitlements")
+    APPLICATIONS_STORE_UPDATE = sys.intern("applications.store.update")
+    BOT = sys.intern("bot")
+    CONNECTIONS = sys.intern("connections")
+    DM_CHANNELS_READ = sys.intern("dm_channels.read")
+    EMAIL = sys.intern("email")
+    GDM_JOIN = sys.intern("gdm.join")
+    GUILDS = sys.intern("guilds")
+    GUILDS_JOIN = sys.intern("guilds.join")
+    GUILDS_MEMBERS_READ = sys.intern("guilds.members.read")
+    IDENTIFY = sys.intern("identify")
+    MESSAGES_READ = sys.intern("messages.read")
+    RELATIONSHIPS_READ = sys.intern("relationships.read")
+    ROLE_CONNECTIONS_WRITE = sys.intern("role_connections.write")
+    RPC = sys.intern("rpc")
+    RPC_ACTIVITIES_WRITE = sys.intern("rpc.activities.write")
+    RPC_NOTIFICATIONS_READ = sys.intern("rpc.notifications.read")
+    RPC_VOICE_READ = sys.intern("rpc.voice.read")
+    RPC_VOICE_WRITE = sys.intern("rpc.voice.write")
+    VOICE = sys.intern("voice")
+    WEBHOOK_INCOMING = sys.intern("webhook.incoming")
\ No newline at end of file
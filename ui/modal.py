@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import os
 import sys
 import time
 import traceback
@@ -14,7 +13,7 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional,
 from ..components import Component
 from ..utils import MISSING
 from .item import Item
-from .view import _component_to_item, _ViewWeights, _walk_all_components
+from .view import _component_to_item, _fresh_id, _ViewWeights, _walk_all_components
 
 __all__ = (
     "Modal",
@@ -93,13 +92,13 @@ class Modal:
         self.title = title
         self.timeout = timeout
         self._provided_custom_id = custom_id is not MISSING
-        self.custom_id = os.urandom(16).hex() if custom_id is MISSING else custom_id
+        self.custom_id = _fresh_id() if custom_id is MISSING else custom_id
         self.auto_defer = auto_defer
 
         self.children = []
         self.__weights = _ViewWeights(self.children)
         loop = asyncio.get_running_loop()
-        self.id: str = os.urandom(16).hex()
+        self.id: str = _fresh_id()
         self.__cancel_callback: Optional[Callable[[Modal], None]] = None
         self.__timeout_expiry: Optional[float] = None
         self.__timeout_task: Optional[asyncio.Task[None]] = None
@@ -6,10 +6,11 @@ import asyncio
 import logging
 import os
 import sys
+import threading
 import time
 import traceback
 from functools import partial
-from itertools import groupby
+from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -21,6 +22,7 @@ from typing import (
     Optional,
     Set,
     Tuple,
+    Type,
 )
 
 from typing_extensions import Self
@@ -45,28 +47,74 @@ if TYPE_CHECKING:
 
 _log = logging.getLogger(__name__)
 
+_RAND_BUF_SIZE = 4096
+_rand_buf: bytes = b""
+_rand_off: int = _RAND_BUF_SIZE
+_rand_lock = threading.Lock()
+
+
+def _fresh_id() -> str:
+    # hands out 16 byte slices of a pooled urandom buffer so that
+    # creating views and modals doesn't cost a syscall each time
+    global _rand_buf, _rand_off
+    with _rand_lock:
+        if _rand_off >= _RAND_BUF_SIZE:
+            _rand_buf = os.urandom(_RAND_BUF_SIZE)
+            _rand_off = 0
+
+        start = _rand_off
+        _rand_off = start + 16
+        return _rand_buf[start : start + 16].hex()
+
+
+def _reset_rand_buf() -> None:
+    # a forked child must not hand out the same ids as its parent, and
+    # the lock may have been held by another thread at fork time
+    global _rand_buf, _rand_off, _rand_lock
+    _rand_buf = b""
+    _rand_off = _RAND_BUF_SIZE
+    _rand_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_rand_buf)
+
 
 def _walk_all_components(components: List[Component]) -> Iterator[Component]:
-    for item in components:
-        if isinstance(item, ActionRowComponent):
-            yield from item.children
-        else:
-            yield item
+    # ActionRow has no subclasses, so an identity check on the type is enough
+    return chain.from_iterable(
+        item.children if type(item) is ActionRowComponent else (item,) for item in components
+    )
 
 
-def _component_to_item(component: Component) -> Item:
-    if isinstance(component, ButtonComponent):
-        from .button import Button
+_component_item_factories: Dict[Type[Component], Callable[[Any], Item]] = {}
+
 
-        return Button.from_component(component)
-    if isinstance(component, SelectComponent):
-        from .select import Select
+def _load_component_item_factories() -> Dict[Type[Component], Callable[[Any], Item]]:
+    # these modules import this one, so they can only be loaded on first use
+    from .button import Button
+    from .select import Select
+    from .text_input import TextInput
+
+    _component_item_factories.update(
+        {
+            ButtonComponent: Button.from_component,
+            SelectComponent: Select.from_component,
+            TextComponent: TextInput.from_component,
+        }
+    )
+    return _component_item_factories
 
-        return Select.from_component(component)
-    if isinstance(component, TextComponent):
-        from .text_input import TextInput
 
-        return TextInput.from_component(component)
+def _component_to_item(component: Component) -> Item:
+    factories = _component_item_factories or _load_component_item_factories()
+    factory = factories.get(type(component))
+    if factory is not None:
+        return factory(component)
+
+    for component_type, factory in factories.items():
+        if isinstance(component, component_type):
+            return factory(component)
     return Item.from_component(component)
 
 
@@ -76,29 +124,44 @@ class _ViewWeights:
     def __init__(self, children: List[Item]) -> None:
         self.weights: List[int] = [0, 0, 0, 0, 0]
 
-        key: Callable[[Item[Any]], int] = lambda i: sys.maxsize if i.row is None else i.row
-        children = sorted(children, key=key)
-        for _, group in groupby(children, key=key):
-            for item in group:
+        # items with an explicit row are placed first so that the
+        # remaining ones fill up whatever space is left
+        for item in children:
+            if item.row is not None:
+                self.add_item(item)
+        for item in children:
+            if item.row is None:
                 self.add_item(item)
 
     def find_open_space(self, item: Item) -> int:
-        for index, weight in enumerate(self.weights):
-            if weight + item.width <= 5:
-                return index
+        # there are always exactly 5 rows, so the search is unrolled
+        weights = self.weights
+        limit = 5 - item.width
+        if weights[0] <= limit:
+            return 0
+        if weights[1] <= limit:
+            return 1
+        if weights[2] <= limit:
+            return 2
+        if weights[3] <= limit:
+            return 3
+        if weights[4] <= limit:
+            return 4
 
         raise ValueError("Could not find open space for item")
 
     def add_item(self, item: Item) -> None:
-        if item.row is not None:
-            total = self.weights[item.row] + item.width
+        weights = self.weights
+        row = item.row
+        if row is not None:
+            total = weights[row] + item.width
             if total > 5:
-                raise ValueError(f"item would not fit at row {item.row} ({total} > 5 width)")
-            self.weights[item.row] = total
-            item._rendered_row = item.row
+                raise ValueError(f"item would not fit at row {row} ({total} > 5 width)")
+            weights[row] = total
+            item._rendered_row = row
         else:
             index = self.find_open_space(item)
-            self.weights[index] += item.width
+            weights[index] += item.width
             item._rendered_row = index
 
     def remove_item(self, item: Item) -> None:
@@ -107,7 +170,8 @@ class _ViewWeights:
             item._rendered_row = None
 
     def clear(self) -> None:
-        self.weights = [0, 0, 0, 0, 0]
+        weights = self.weights
+        weights[0] = weights[1] = weights[2] = weights[3] = weights[4] = 0
 
 
 class View:
@@ -149,20 +213,39 @@ class View:
 
     __discord_ui_view__: ClassVar[bool] = True
     __view_children_items__: ClassVar[List[ItemCallbackType]] = []
+    __view_own_items__: ClassVar[List[ItemCallbackType]] = []
+    __view_children_prebuilt__: ClassVar[
+        List[Tuple[Callable[..., Item], Dict[str, Any], str, ItemCallbackType]]
+    ] = []
 
     def __init_subclass__(cls) -> None:
+        # the decorated members defined directly on each view subclass are
+        # recorded once, so only mixins that aren't views get their namespace scanned
+        cls.__view_own_items__ = [
+            member
+            for member in cls.__dict__.values()
+            if hasattr(member, "__discord_ui_model_type__")
+        ]
+
         children: List[ItemCallbackType] = []
         for base in reversed(cls.__mro__):
-            children.extend(
-                member
-                for member in base.__dict__.values()
-                if hasattr(member, "__discord_ui_model_type__")
-            )
+            own = base.__dict__.get("__view_own_items__")
+            if own is None:
+                own = [
+                    member
+                    for member in base.__dict__.values()
+                    if hasattr(member, "__discord_ui_model_type__")
+                ]
+            children.extend(own)
 
         if len(children) > 25:
             raise TypeError("View cannot have more than 25 children")
 
         cls.__view_children_items__ = children
+        cls.__view_children_prebuilt__ = [
+            (func.__discord_ui_model_type__, func.__discord_ui_model_kwargs__, func.__name__, func)
+            for func in children
+        ]
 
     def __init__(
         self,
@@ -175,16 +258,31 @@ class View:
         self.auto_defer = auto_defer
         self.prevent_update = True if timeout else prevent_update
         self.children: List[Item] = []
-        for func in self.__view_children_items__:
-            item: Item = func.__discord_ui_model_type__(**func.__discord_ui_model_kwargs__)
-            item.callback = partial(func, self, item)  # type: ignore
+        # whether every child is persistent, reset whenever the children change
+        self._persistent_cache: Optional[bool] = None
+        # custom_id -> dispatchable item, used by refresh
+        self._custom_id_index: Dict[str, Item[Any]] = {}
+        for factory, kwargs, name, func in self.__view_children_prebuilt__:
+            item: Item = factory(**kwargs)
+
+            # the defaults bind this iteration's values into the closure
+            def callback(interaction: Interaction, _func=func, _view=self, _item=item):
+                return _func(_view, _item, interaction)
+
+            item.callback = callback  # type: ignore
             item._view = self
-            setattr(self, func.__name__, item)
+            setattr(self, name, item)
             self.children.append(item)
+            self._index_item(item)
 
         self.__weights = _ViewWeights(self.children)
+        # children bucketed by their rendered row, kept in step with self.children
+        self._rows: List[List[Item]] = [[], [], [], [], []]
+        for item in self.children:
+            self._rows[item._rendered_row or 0].append(item)
         loop = asyncio.get_running_loop()
-        self.id: str = os.urandom(16).hex()
+        self.id: str = _fresh_id()
+        self.__dispatch_task_name: str = f"discord-ui-view-dispatch-{self.id}"
         self.__cancel_callback: Optional[Callable[[View], None]] = None
         self.__timeout_expiry: Optional[float] = None
         self.__timeout_task: Optional[asyncio.Task[None]] = None
@@ -212,24 +310,11 @@ class View:
             await asyncio.sleep(self.__timeout_expiry - now)
 
     def to_components(self) -> List[ActionRowPayload]:
-        def key(item: Item) -> int:
-            return item._rendered_row or 0
-
-        children = sorted(self.children, key=key)
-        components: List[ActionRowPayload] = []
-        for _, group in groupby(children, key=key):
-            children = [item.to_component_dict() for item in group]
-            if not children:
-                continue
-
-            components.append(
-                {
-                    "type": 1,
-                    "components": children,
-                }
-            )
-
-        return components
+        return [
+            {"type": 1, "components": [item.to_component_dict() for item in group]}
+            for group in self._rows
+            if group
+        ]
 
     @classmethod
     def from_message(cls, message: Message, /, *, timeout: Optional[float] = 180.0) -> View:
@@ -298,6 +383,9 @@ class View:
 
         item._view = self
         self.children.append(item)
+        self._rows[item._rendered_row or 0].append(item)
+        self._index_item(item)
+        self._persistent_cache = None
 
     def remove_item(self, item: Item) -> None:
         """Removes an item from the view.
@@ -313,12 +401,32 @@ class View:
         except ValueError:
             pass
         else:
+            self._rows[item._rendered_row or 0].remove(item)
             self.__weights.remove_item(item)
+            self._unindex_item(item)
+            self._persistent_cache = None
 
     def clear_items(self) -> None:
         """Removes all items from the view."""
         self.children.clear()
+        for row in self._rows:
+            row.clear()
         self.__weights.clear()
+        self._custom_id_index.clear()
+        self._persistent_cache = None
+
+    def _index_item(self, item: Item) -> None:
+        if item.is_dispatchable():
+            self._custom_id_index[item.custom_id] = item  # type: ignore
+
+    def _unindex_item(self, item: Item) -> None:
+        if item.is_dispatchable() and self._custom_id_index.get(item.custom_id) is item:  # type: ignore
+            del self._custom_id_index[item.custom_id]  # type: ignore
+
+    def _rebuild_custom_id_index(self) -> None:
+        self._custom_id_index = {
+            item.custom_id: item for item in self.children if item.is_dispatchable()  # type: ignore
+        }
 
     async def interaction_check(self, interaction: Interaction) -> bool:
         """|coro|
@@ -394,7 +502,7 @@ class View:
             return await self.on_error(e, item, interaction)
 
     def _start_listening_from_store(self, store: ViewStore) -> None:
-        self.__cancel_callback = partial(store.remove_view)
+        self.__cancel_callback = partial(store._remove_finished)
         if self.timeout:
             loop = asyncio.get_running_loop()
             if self.__timeout_task is not None:
@@ -412,36 +520,45 @@ class View:
         task.add_done_callback(self.__background_tasks.discard)
         self.__stopped.set_result(True)
 
+        if self.__cancel_callback:
+            self.__cancel_callback(self)
+            self.__cancel_callback = None
+
     def _dispatch_item(self, item: Item, interaction: Interaction) -> None:
         if self.__stopped.done():
             return
 
+        tasks = self.__background_tasks
         task = asyncio.create_task(
-            self._scheduled_task(item, interaction), name=f"discord-ui-view-dispatch-{self.id}"
+            self._scheduled_task(item, interaction), name=self.__dispatch_task_name
         )
-        self.__background_tasks.add(task)
-        task.add_done_callback(self.__background_tasks.discard)
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
 
     def refresh(self, components: List[Component]) -> None:
-        old_state: Dict[str, Item[Any]] = {
-            item.custom_id: item for item in self.children if item.is_dispatchable()  # type: ignore
-        }
-
+        self._persistent_cache = None
+        rebuilt = False
         for component in _walk_all_components(components):
             custom_id = getattr(component, "custom_id", None)
             if custom_id is None:
                 continue
 
-            try:
-                older = old_state[custom_id]
-            except KeyError:
+            older = self._custom_id_index.get(custom_id)
+            # an item's custom_id can be reassigned after it was added,
+            # so a miss or a mismatch rebuilds the index once before giving up
+            if (older is None or older.custom_id != custom_id) and not rebuilt:  # type: ignore
+                self._rebuild_custom_id_index()
+                rebuilt = True
+                older = self._custom_id_index.get(custom_id)
+
+            if older is None:
                 _log.debug(
                     "View interaction referenced an unknown item custom_id %s. Discarding",
                     custom_id,
                 )
                 continue
-            else:
-                older.refresh_component(component)
+
+            older.refresh_component(component)
 
     def stop(self) -> None:
         """Stops listening to interaction events from this view.
@@ -474,7 +591,12 @@ class View:
         A persistent view has all their components with a set ``custom_id`` and
         a :attr:`timeout` set to ``None``.
         """
-        return self.timeout is None and all(item.is_persistent() for item in self.children)
+        if self.timeout is not None:
+            return False
+
+        if self._persistent_cache is None:
+            self._persistent_cache = all(item.is_persistent() for item in self.children)
+        return self._persistent_cache
 
     async def wait(self) -> bool:
         """Waits until the view has finished interacting.
@@ -497,6 +619,10 @@ class ViewStore:
         """(component_type, message_id, custom_id): (View, Item)"""
         self._synced_message_views: Dict[int, View] = {}
         """message_id: View"""
+        self._view_id_to_message_id: Dict[str, int] = {}
+        """view_id: message_id"""
+        self._view_keys: Dict[str, Set[Tuple[int, Optional[int], str]]] = {}
+        """view_id: keys registered in _views"""
         self._state: ConnectionState = state
 
     def all_views(self) -> List[View]:
@@ -509,40 +635,52 @@ class ViewStore:
         views = self.all_views()
         return [v for v in views if v.is_persistent() ^ (not persistent)]
 
-    def __verify_integrity(self) -> None:
-        to_remove: List[Tuple[int, Optional[int], str]] = []
-        for k, (view, _) in self._views.items():
-            if view.is_finished():
-                to_remove.append(k)
-
-        for k in to_remove:
-            del self._views[k]
-
     def add_view(self, view: View, message_id: Optional[int] = None) -> None:
-        self.__verify_integrity()
+        if view.is_finished():
+            return
 
         view._start_listening_from_store(self)
+        keys = self._view_keys.setdefault(view.id, set())
         for item in view.children:
             if item.is_dispatchable():
-                self._views[(item.type.value, message_id, item.custom_id)] = (view, item)  # type: ignore
+                key = (item.type.value, message_id, item.custom_id)  # type: ignore
+                self._views[key] = (view, item)
+                keys.add(key)
 
         if message_id is not None:
             self._synced_message_views[message_id] = view
+            self._view_id_to_message_id[view.id] = message_id
 
     def remove_view(self, view: View, message_id: Optional[int] = None) -> None:
+        keys = self._view_keys.get(view.id)
         for item in view.children:
             if item.is_dispatchable():
-                self._views.pop((item.type.value, message_id, item.custom_id), None)  # type: ignore
+                key = (item.type.value, message_id, item.custom_id)  # type: ignore
+                self._views.pop(key, None)
+                if keys is not None:
+                    keys.discard(key)
+
+        if not keys:
+            self._view_keys.pop(view.id, None)
+
+        synced_message_id = self._view_id_to_message_id.pop(view.id, None)
+        if synced_message_id is not None:
+            self._synced_message_views.pop(synced_message_id, None)
 
-        for key, value in self._synced_message_views.items():
-            if value.id == view.id:
-                del self._synced_message_views[key]
-                break
+    def _remove_finished(self, view: View) -> None:
+        # called by the view itself once it stops or times out, so only its own keys are touched
+        for key in self._view_keys.pop(view.id, ()):
+            value = self._views.get(key)
+            if value is not None and value[0] is view:
+                del self._views[key]
+
+        synced_message_id = self._view_id_to_message_id.pop(view.id, None)
+        if synced_message_id is not None:
+            self._synced_message_views.pop(synced_message_id, None)
 
     def dispatch(
         self, component_type: int, custom_id: str, interaction: Interaction[ClientT]
     ) -> None:
-        self.__verify_integrity()
         message_id: Optional[int] = interaction.message and interaction.message.id
         key = (component_type, message_id, custom_id)
         # Fallback to None message_id searches in case a persistent view
@@ -559,7 +697,10 @@ class ViewStore:
         return message_id in self._synced_message_views
 
     def remove_message_tracking(self, message_id: int) -> Optional[View]:
-        return self._synced_message_views.pop(message_id, None)
+        view = self._synced_message_views.pop(message_id, None)
+        if view is not None and self._view_id_to_message_id.get(view.id) == message_id:
+            del self._view_id_to_message_id[view.id]
+        return view
 
     def update_from_message(self, message_id: int, components: List[ComponentPayload]) -> None:
         # pre-req: is_message_tracked == true
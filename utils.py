@@ -513,14 +513,26 @@ def _bytes_to_base64_data(data: bytes) -> str:
     return fmt.format(mime=mime, data=b64)
 
 
+# images at least this large are base64 encoded in the default executor
+_BASE64_EXECUTOR_THRESHOLD = 1 << 16
+
+
+async def _bytes_to_base64_data_async(data: bytes) -> str:
+    if len(data) < _BASE64_EXECUTOR_THRESHOLD:
+        return _bytes_to_base64_data(data)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _bytes_to_base64_data, data)
+
+
 async def obj_to_base64_data(obj: Optional[Union[bytes, Attachment, Asset, File]]) -> Optional[str]:
     if obj is None:
         return obj
     if isinstance(obj, bytes):
-        return _bytes_to_base64_data(obj)
+        return await _bytes_to_base64_data_async(obj)
     if isinstance(obj, File):
-        return _bytes_to_base64_data(obj.fp.read())
-    return _bytes_to_base64_data(await obj.read())
+        loop = asyncio.get_running_loop()
+        return await _bytes_to_base64_data_async(await loop.run_in_executor(None, obj.fp.read))
+    return await _bytes_to_base64_data_async(await obj.read())
 
 
 def parse_ratelimit_header(request: Any, *, use_clock: bool = False) -> float:
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
 import logging
+import random
 import re
-from contextvars import ContextVar
+import time
+from collections import OrderedDict
+from functools import lru_cache, partial
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
@@ -23,7 +25,6 @@ from typing import (
     overload,
 )
 from urllib.parse import quote as urlquote
-from weakref import WeakValueDictionary
 
 import aiohttp
 
@@ -59,21 +60,169 @@ if TYPE_CHECKING:
     from ..mentions import AllowedMentions
     from ..state import ConnectionState
     from ..types.message import Message as MessagePayload
-    from ..types.snowflake import Snowflake as SnowflakeAlias
     from ..types.webhook import Webhook as WebhookPayload
     from ..ui.view import View
 
 MISSING = utils.MISSING
 
+_WEBHOOK_URL_RE = re.compile(
+    r"discord(?:app)?\.com/api/webhooks/(?P<id>[0-9]{17,20})/(?P<token>[A-Za-z0-9\.\-\_]{60,68})"
+)
+_WEBHOOK_URL_TEMPLATE = "https://discord.com/api/webhooks/%s/%s"
+
+# shared query strings for execute_webhook, these must never be mutated
+_WAIT_PARAMS: Dict[str, Any] = {"wait": 1}
+_NO_WAIT_PARAMS: Dict[str, Any] = {"wait": 0}
+
+_SUPPRESS_EMBEDS_FLAG: int = MessageFlags.suppress_embeds.flag
+_EPHEMERAL_FLAG: int = MessageFlags.ephemeral.flag
+
+
+@lru_cache(maxsize=1024)
+def _route(method: str, path: str, **parameters: Any) -> Route:
+    # routes are never mutated after creation, so the formatted ones for
+    # long lived webhooks can be shared between requests; routes that also
+    # carry a message id are one-off and built directly instead
+    return Route(method, path, **parameters)
+
+
+@lru_cache(maxsize=256)
+def _quote_reason(reason: str) -> str:
+    # audit log reasons are mostly a handful of canned strings
+    return urlquote(reason, safe="/ ")
+
+
+async def _backoff_sleep(attempt: int) -> None:
+    # full jitter exponential backoff, so that clients failing together
+    # don't all retry at the same moment
+    await asyncio.sleep(random.uniform(0, min(30.0, 2.0**attempt)))
+
+
+class _WebhookBucket:
+    """Concurrency limit and pre-emptive rate limit gate for a single webhook."""
+
+    __slots__ = (
+        "semaphore",
+        "ready",
+        "delaying",
+        "limit",
+        "remaining",
+        "reset_at",
+        "window",
+    )
+
+    # the number of requests allowed in flight for the same webhook at once
+    CONCURRENCY = 5
+
+    def __init__(self) -> None:
+        self.semaphore: asyncio.Semaphore = asyncio.Semaphore(self.CONCURRENCY)
+        # cleared while a request is waiting out an exhausted rate limit
+        self.ready: asyncio.Event = asyncio.Event()
+        self.ready.set()
+        self.delaying: int = 0
+        # token bucket state learned from the rate limit headers,
+        # ``remaining`` is None until the first response has been seen
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: float = 0.0
+        # X-Ratelimit-Reset of the window ``remaining`` was learned from
+        self.window: float = 0.0
+
+    async def acquire_token(self) -> None:
+        while True:
+            if self.remaining is None:
+                return
+
+            if self.remaining > 0:
+                self.remaining -= 1
+                return
+
+            delay = self.reset_at - time.monotonic()
+            if delay <= 0:
+                # the window has reset, refill and take a token for this request
+                self.remaining = self.limit - 1 if self.limit else None
+                return
+
+            await asyncio.sleep(delay)
+
+    def update(self, response: aiohttp.ClientResponse) -> None:
+        headers = response.headers
+        limit = headers.get("X-Ratelimit-Limit")
+        remaining = headers.get("X-Ratelimit-Remaining")
+        reset_after = headers.get("X-Ratelimit-Reset-After")
+        if limit is None or remaining is None or reset_after is None:
+            return
+
+        now = time.monotonic()
+        reset = headers.get("X-Ratelimit-Reset")
+        if reset is not None:
+            # late responses from an older window carry a smaller reset and are ignored here
+            window = float(reset)
+            new_window = window > self.window
+            if new_window:
+                self.window = window
+        else:
+            new_window = now >= self.reset_at
+
+        self.limit = int(limit)
+        server_remaining = int(remaining)
+        if new_window or self.remaining is None:
+            # the server opened a new window, its quota replaces whatever was left locally
+            self.remaining = server_remaining
+            self.reset_at = now + float(reset_after)
+        elif server_remaining < self.remaining:
+            # within a window requests still in flight have already taken
+            # their tokens, so never hand back more than what's left locally
+            self.remaining = server_remaining
+
+    def exhaust(self, retry_after: float) -> None:
+        self.remaining = 0
+        self.reset_at = time.monotonic() + retry_after
+
+
+class _BucketCache(OrderedDict):
+    """Least recently used map of webhook buckets.
+
+    Unlike a weak map this keeps idle buckets, and their rate limit state,
+    around between requests while still bounding memory.
+    """
+
+    # the number of webhooks whose buckets are remembered
+    MAX_SIZE = 1024
+
+    def __getitem__(self, key: Any) -> _WebhookBucket:
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: Any, value: _WebhookBucket) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.MAX_SIZE:
+            # a bucket evicted while in use stays alive through the request holding it
+            self.popitem(last=False)
+
 
 class AsyncDeferredLock:
-    def __init__(self, lock: asyncio.Lock) -> None:
-        self.lock = lock
+    __slots__ = ("bucket", "delta")
+
+    def __init__(self, bucket: _WebhookBucket) -> None:
+        self.bucket = bucket
         self.delta: Optional[float] = None
 
     async def __aenter__(self):
-        await self.lock.acquire()
-        return self
+        bucket = self.bucket
+        ready = bucket.ready
+        semaphore = bucket.semaphore
+        while True:
+            await ready.wait()
+            await semaphore.acquire()
+            if ready.is_set():
+                return self
+
+            # a rate limit hit while this request queued on the semaphore,
+            # give the slot back and wait it out with everyone else
+            semaphore.release()
 
     def delay_by(self, delta: float) -> None:
         self.delta = delta
@@ -84,17 +233,114 @@ class AsyncDeferredLock:
         value: Optional[BaseException],
         traceback: Optional[TracebackType],
     ) -> None:
-        if self.delta:
-            await asyncio.sleep(self.delta)
-        self.lock.release()
+        bucket = self.bucket
+        try:
+            if self.delta:
+                # hold back new requests for this webhook until the rate limit resets
+                bucket.delaying += 1
+                bucket.ready.clear()
+                try:
+                    await asyncio.sleep(self.delta)
+                finally:
+                    bucket.delaying -= 1
+                    if not bucket.delaying:
+                        bucket.ready.set()
+        finally:
+            bucket.semaphore.release()
 
 
 class AsyncWebhookAdapter:
+    # bounds for the execute_webhook worker pool used by submit_execute_webhook
+    MAX_QUEUED_EXECUTIONS = 1000
+    EXECUTION_WORKERS = 16
+
     def __init__(self) -> None:
-        self._locks: WeakValueDictionary[
-            Tuple[Optional[SnowflakeAlias], Optional[str]],
-            asyncio.Lock,
-        ] = WeakValueDictionary()
+        self._locks: _BucketCache = _BucketCache()
+        """(webhook_id, webhook_token): _WebhookBucket"""
+        self._queue: Optional[
+            asyncio.Queue[Tuple[Tuple[Any, ...], Dict[str, Any], asyncio.Future[Any]]]
+        ] = None
+        self._workers: List[asyncio.Task[None]] = []
+        # the loop the buckets and the worker pool belong to
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _bind_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._loop is loop:
+            return
+
+        # the adapter is shared module-wide, but the buckets' semaphores and events
+        # and the worker pool all belong to the loop that first used them
+        for task in self._workers:
+            task_loop = task.get_loop()
+            if not task.done() and not task_loop.is_closed():
+                task_loop.call_soon_threadsafe(task.cancel)
+        self._workers = []
+        self._queue = None
+        self._locks.clear()
+        self._loop = loop
+
+    async def close(self) -> None:
+        """Stops the worker pool started by :meth:`submit_execute_webhook`.
+
+        Executions still waiting in the queue are cancelled.
+        """
+        workers, self._workers = self._workers, []
+        queue, self._queue = self._queue, None
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        if queue is not None:
+            while not queue.empty():
+                _, _, future = queue.get_nowait()
+                future.cancel()
+
+    @property
+    def queued_executions(self) -> int:
+        """The number of executions waiting for a worker in :meth:`submit_execute_webhook`."""
+        return 0 if self._queue is None else self._queue.qsize()
+
+    async def _execution_worker(
+        self,
+        queue: asyncio.Queue[Tuple[Tuple[Any, ...], Dict[str, Any], asyncio.Future[Any]]],
+    ) -> None:
+        while True:
+            args, kwargs, future = await queue.get()
+            try:
+                if future.cancelled():
+                    continue
+
+                try:
+                    result = await self.execute_webhook(*args, **kwargs)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+            finally:
+                queue.task_done()
+
+    async def submit_execute_webhook(self, *args: Any, **kwargs: Any) -> asyncio.Future[Any]:
+        """Queues an :meth:`execute_webhook` call for a bounded pool of workers.
+
+        Waits while the queue is full, so that bursts of sends apply backpressure to
+        the caller instead of piling up unbounded coroutines. The returned future
+        resolves to the result of :meth:`execute_webhook`.
+        """
+        loop = asyncio.get_running_loop()
+        self._bind_loop(loop)
+        queue = self._queue
+        if queue is None:
+            queue = self._queue = asyncio.Queue(maxsize=self.MAX_QUEUED_EXECUTIONS)
+            self._workers = [
+                loop.create_task(self._execution_worker(queue))
+                for _ in range(self.EXECUTION_WORKERS)
+            ]
+
+        future: asyncio.Future[Any] = loop.create_future()
+        await queue.put((args, kwargs, future))
+        return future
 
     async def request(
         self,
@@ -112,12 +358,15 @@ class AsyncWebhookAdapter:
         headers: Dict[str, str] = {"User-Agent": _USER_AGENT}
         files = files or []
         to_send: Optional[Union[str, aiohttp.FormData]] = None
-        bucket = (route.webhook_id, route.webhook_token)
+        key = (route.webhook_id, route.webhook_token)
+
+        loop = asyncio.get_running_loop()
+        self._bind_loop(loop)
 
         try:
-            lock = self._locks[bucket]
+            bucket = self._locks[key]
         except KeyError:
-            self._locks[bucket] = lock = asyncio.Lock()
+            self._locks[key] = bucket = _WebhookBucket()
 
         if payload is not None:
             headers["Content-Type"] = "application/json"
@@ -127,7 +376,7 @@ class AsyncWebhookAdapter:
             headers["Authorization"] = f"Bot {auth_token}"
 
         if reason is not None:
-            headers["X-Audit-Log-Reason"] = urlquote(reason, safe="/ ")
+            headers["X-Audit-Log-Reason"] = _quote_reason(reason)
 
         response: Optional[aiohttp.ClientResponse] = None
         data: Optional[Union[Dict[str, Any], str]] = None
@@ -135,10 +384,23 @@ class AsyncWebhookAdapter:
         url = route.url
         webhook_id = route.webhook_id
 
-        async with AsyncDeferredLock(lock) as lock:
-            for attempt in range(5):
-                for file in files:
-                    file.reset(seek=attempt)
+        async with AsyncDeferredLock(bucket) as deferred:
+            # short rate limits are retried without using up one of the 5 attempts,
+            # so the number of requests made is tracked separately for the file seeks
+            attempt = 0
+            tries = 0
+            rate_limit_retries = 0
+            while attempt < 5:
+                # the first request needs no seek, and a retry rewinds the files in the
+                # default executor so a slow disk doesn't stall the event loop
+                if files and tries:
+                    await asyncio.gather(
+                        *(
+                            loop.run_in_executor(None, partial(file.reset, seek=True))
+                            for file in files
+                        )
+                    )
+                tries += 1
 
                 if multipart:
                     form_data = aiohttp.FormData(quote_fields=False)
@@ -146,6 +408,7 @@ class AsyncWebhookAdapter:
                         form_data.add_field(**p)
                     to_send = form_data
 
+                await bucket.acquire_token()
                 try:
                     async with session.request(
                         method, url, data=to_send, headers=headers, params=params
@@ -157,10 +420,15 @@ class AsyncWebhookAdapter:
                             url,
                             response.status,
                         )
-                        data = (await response.text(encoding="utf-8")) or None
-                        if data and response.headers["Content-Type"] == "application/json":
-                            data = json.loads(data)
-
+                        # JSON bodies are parsed straight from the raw bytes, and a
+                        # missing Content-Type (Cloudflare error pages) is treated as text
+                        if response.headers.get("Content-Type") == "application/json":
+                            raw = await response.read()
+                            data = utils.from_json(raw) if raw else None
+                        else:
+                            data = (await response.text(encoding="utf-8")) or None
+
+                        bucket.update(response)
                         remaining = response.headers.get("X-Ratelimit-Remaining")
                         if remaining == "0" and response.status != 429:
                             delta = utils.parse_ratelimit_header(response)
@@ -169,7 +437,7 @@ class AsyncWebhookAdapter:
                                 webhook_id,
                                 delta,
                             )
-                            lock.delay_by(delta)
+                            deferred.delay_by(delta)
 
                         if 300 > response.status >= 200:
                             return data
@@ -178,17 +446,41 @@ class AsyncWebhookAdapter:
                             if not response.headers.get("Via"):
                                 raise HTTPException(response, data)
 
-                            retry_after: float = data["retry_after"]  # type: ignore
+                            retry_after: Optional[float] = (
+                                data.get("retry_after") if isinstance(data, dict) else None
+                            )
+                            if retry_after is None:
+                                try:
+                                    retry_after = float(response.headers["Retry-After"])
+                                except (KeyError, ValueError):
+                                    pass
+
+                            if retry_after is None:
+                                _log.warning(
+                                    "Webhook ID %s is rate limited without a retry_after. Backing off",
+                                    webhook_id,
+                                )
+                                await _backoff_sleep(attempt)
+                                attempt += 1
+                                continue
+
+                            retry_after = min(float(retry_after), 60.0)
+                            bucket.exhaust(retry_after)
                             _log.warning(
                                 "Webhook ID %s is rate limited. Retrying in %.2f seconds",
                                 webhook_id,
                                 retry_after,
                             )
                             await asyncio.sleep(retry_after)
+                            if retry_after < 2.0 and rate_limit_retries < 3:
+                                rate_limit_retries += 1
+                            else:
+                                attempt += 1
                             continue
 
                         if response.status >= 500:
-                            await asyncio.sleep(1 + attempt * 2)
+                            await _backoff_sleep(attempt)
+                            attempt += 1
                             continue
 
                         if response.status == 403:
@@ -201,7 +493,8 @@ class AsyncWebhookAdapter:
 
                 except OSError as e:
                     if attempt < 4 and e.errno in (54, 10054):
-                        await asyncio.sleep(1 + attempt * 2)
+                        await _backoff_sleep(attempt)
+                        attempt += 1
                         continue
                     raise
 
@@ -220,7 +513,7 @@ class AsyncWebhookAdapter:
         session: aiohttp.ClientSession,
         reason: Optional[str] = None,
     ) -> Response[None]:
-        route = Route("DELETE", "/webhooks/{webhook_id}", webhook_id=webhook_id)
+        route = _route("DELETE", "/webhooks/{webhook_id}", webhook_id=webhook_id)
         return self.request(route, session, reason=reason, auth_token=token)
 
     def delete_webhook_with_token(
@@ -231,7 +524,7 @@ class AsyncWebhookAdapter:
         session: aiohttp.ClientSession,
         reason: Optional[str] = None,
     ) -> Response[None]:
-        route = Route(
+        route = _route(
             "DELETE",
             "/webhooks/{webhook_id}/{webhook_token}",
             webhook_id=webhook_id,
@@ -248,7 +541,7 @@ class AsyncWebhookAdapter:
         session: aiohttp.ClientSession,
         reason: Optional[str] = None,
     ) -> Response[WebhookPayload]:
-        route = Route("PATCH", "/webhooks/{webhook_id}", webhook_id=webhook_id)
+        route = _route("PATCH", "/webhooks/{webhook_id}", webhook_id=webhook_id)
         return self.request(route, session, reason=reason, payload=payload, auth_token=token)
 
     def edit_webhook_with_token(
@@ -260,7 +553,7 @@ class AsyncWebhookAdapter:
         session: aiohttp.ClientSession,
         reason: Optional[str] = None,
     ) -> Response[WebhookPayload]:
-        route = Route(
+        route = _route(
             "PATCH",
             "/webhooks/{webhook_id}/{webhook_token}",
             webhook_id=webhook_id,
@@ -280,10 +573,10 @@ class AsyncWebhookAdapter:
         thread_id: Optional[int] = None,
         wait: bool = False,
     ) -> Response[Optional[MessagePayload]]:
-        params = {"wait": int(wait)}
+        params: Dict[str, Any] = _WAIT_PARAMS if wait else _NO_WAIT_PARAMS
         if thread_id:
-            params["thread_id"] = thread_id
-        route = Route(
+            params = {**params, "thread_id": thread_id}
+        route = _route(
             "POST",
             "/webhooks/{webhook_id}/{webhook_token}",
             webhook_id=webhook_id,
@@ -293,6 +586,35 @@ class AsyncWebhookAdapter:
             route, session, payload=payload, multipart=multipart, files=files, params=params
         )
 
+    async def execute_webhook_batch(
+        self,
+        webhook_id: int,
+        token: str,
+        items: List[ExecuteWebhookParameters],
+        *,
+        session: aiohttp.ClientSession,
+        thread_id: Optional[int] = None,
+        wait: bool = False,
+    ) -> List[Optional[MessagePayload]]:
+        # the sends overlap, bounded by the webhook's bucket concurrency and rate limit
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(
+                    self.execute_webhook(
+                        webhook_id,
+                        token,
+                        session=session,
+                        payload=item.payload,
+                        multipart=item.multipart,
+                        files=item.files,
+                        thread_id=thread_id,
+                        wait=wait,
+                    )
+                )
+                for item in items
+            ]
+        return [task.result() for task in tasks]
+
     def get_webhook_message(
         self,
         webhook_id: int,
@@ -322,9 +644,7 @@ class AsyncWebhookAdapter:
         files: Optional[List[File]] = None,
         thread_id: Optional[int] = None,
     ) -> Response[Message]:
-        params = {}
-        if thread_id:
-            params["thread_id"] = thread_id
+        params = {"thread_id": thread_id} if thread_id else None
         route = Route(
             "PATCH",
             "/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}",
@@ -360,7 +680,7 @@ class AsyncWebhookAdapter:
         *,
         session: aiohttp.ClientSession,
     ) -> Response[WebhookPayload]:
-        route = Route("GET", "/webhooks/{webhook_id}", webhook_id=webhook_id)
+        route = _route("GET", "/webhooks/{webhook_id}", webhook_id=webhook_id)
         return self.request(route, session=session, auth_token=token)
 
     def fetch_webhook_with_token(
@@ -370,7 +690,7 @@ class AsyncWebhookAdapter:
         *,
         session: aiohttp.ClientSession,
     ) -> Response[WebhookPayload]:
-        route = Route(
+        route = _route(
             "GET",
             "/webhooks/{webhook_id}/{webhook_token}",
             webhook_id=webhook_id,
@@ -544,21 +864,27 @@ def handle_message_parameters(
         else:
             payload["components"] = []
 
-    payload["tts"] = tts
+    if tts:
+        payload["tts"] = True
     if avatar_url:
         payload["avatar_url"] = str(avatar_url)
     if username:
         payload["username"] = username
 
-    if flags is None:
-        flags = MessageFlags()
+    flags_value = 0 if flags is None else flags.value
     if suppress_embeds is not None:
-        flags.suppress_embeds = suppress_embeds
+        if suppress_embeds:
+            flags_value |= _SUPPRESS_EMBEDS_FLAG
+        else:
+            flags_value &= ~_SUPPRESS_EMBEDS_FLAG
     if ephemeral is not None:
-        flags.ephemeral = ephemeral
+        if ephemeral:
+            flags_value |= _EPHEMERAL_FLAG
+        else:
+            flags_value &= ~_EPHEMERAL_FLAG
 
-    if flags.value != 0:
-        payload["flags"] = flags.value
+    if flags_value != 0:
+        payload["flags"] = flags_value
 
     if allowed_mentions:
         if previous_allowed_mentions is not None:
@@ -570,17 +896,19 @@ def handle_message_parameters(
     elif previous_allowed_mentions is not None:
         payload["allowed_mentions"] = previous_allowed_mentions.to_dict()
 
-    multipart = []
+    multipart: List[Dict[str, Any]] = []
     if file is not MISSING:
         files = [file]
 
     if files:
-        multipart.append({"name": "payload_json"})
+        payload_attachments = payload["attachments"]
+        multipart = [{"name": "payload_json"}]
         for index, file in enumerate(files):  # noqa: PLR1704
-            payload["attachments"].append(
+            filename = file.filename
+            payload_attachments.append(
                 {
                     "id": index,
-                    "filename": file.filename,
+                    "filename": filename,
                     "description": file.description,  # type: ignore
                     # ignore complaints about assigning to an Attachment
                 }
@@ -589,7 +917,7 @@ def handle_message_parameters(
                 {
                     "name": f"files[{index}]",
                     "value": file.fp,
-                    "filename": file.filename,
+                    "filename": filename,
                     "content_type": "application/octet-stream",
                 }
             )
@@ -599,9 +927,13 @@ def handle_message_parameters(
     return ExecuteWebhookParameters(payload=payload, multipart=multipart, files=files)
 
 
-async_context: ContextVar[AsyncWebhookAdapter] = ContextVar(
-    "async_webhook_context", default=AsyncWebhookAdapter()
-)
+_default_adapter = AsyncWebhookAdapter()
+
+
+def _get_adapter() -> AsyncWebhookAdapter:
+    # the adapter was never overridden per task, so a plain module global
+    # replaces the ContextVar lookup on every webhook call
+    return _default_adapter
 
 
 class PartialWebhookChannel(Hashable):
@@ -671,7 +1003,7 @@ class _FriendlyHttpAttributeErrorHelper:
 
 
 class _WebhookState:
-    __slots__ = ("_parent", "_webhook")
+    __slots__ = ("_parent", "_webhook", "http")
 
     def __init__(
         self, webhook: Any, parent: Optional[Union[ConnectionState, _WebhookState]]
@@ -684,6 +1016,14 @@ class _WebhookState:
         else:
             self._parent = parent
 
+        # the parent's HTTPClient never changes, so it's resolved once instead
+        # of going through a property on every request.
+        # Some data classes assign state.http and that should be kosher
+        # however, using it should result in a late-binding error.
+        self.http: Any = (
+            self._parent.http if self._parent is not None else _FriendlyHttpAttributeErrorHelper()
+        )
+
     def _get_guild(self, guild_id):
         if self._parent is not None:
             return self._parent._get_guild(guild_id)
@@ -699,15 +1039,6 @@ class _WebhookState:
         # state parameter is artificial
         return BaseUser(state=self, data=data)  # type: ignore
 
-    @property
-    def http(self):
-        if self._parent is not None:
-            return self._parent.http
-
-        # Some data classes assign state.http and that should be kosher
-        # however, using it should result in a late-binding error.
-        return _FriendlyHttpAttributeErrorHelper()
-
     def __getattr__(self, attr):
         if self._parent is not None:
             return getattr(self._parent, attr)
@@ -727,6 +1058,8 @@ class WebhookMessage(Message):
     .. versionadded:: 1.6
     """
 
+    __slots__ = ()
+
     _state: _WebhookState
 
     async def edit(
@@ -846,14 +1179,17 @@ class WebhookMessage(Message):
 
         if delay is not None:
 
-            async def inner_call(delay: float = delay) -> None:
-                await asyncio.sleep(delay)
+            async def inner_call() -> None:
                 with contextlib.suppress(HTTPException):
                     await self._state._webhook.delete_message(self.id)
 
-            task = asyncio.create_task(inner_call())
-            self._background_tasks.add(task)
-            task.add_done_callback(self._background_tasks.discard)
+            def schedule() -> None:
+                task = asyncio.create_task(inner_call())
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+
+            # a timer handle instead of a task parked in asyncio.sleep for the whole delay
+            asyncio.get_running_loop().call_later(delay, schedule)
         else:
             await self._state._webhook.delete_message(self.id)
 
@@ -872,6 +1208,7 @@ class BaseWebhook(Hashable):
         "source_channel",
         "source_guild",
         "_state",
+        "_is_application",
     )
 
     def __init__(
@@ -889,6 +1226,7 @@ class BaseWebhook(Hashable):
     def _update(self, data: WebhookPayload) -> None:
         self.id = int(data["id"])
         self.type = try_enum(WebhookType, int(data["type"]))
+        self._is_application: bool = self.type is WebhookType.application
         self.channel_id = utils.get_as_snowflake(data, "channel_id")
         self.guild_id = utils.get_as_snowflake(data, "guild_id")
         self.name = data.get("name")
@@ -926,6 +1264,16 @@ class BaseWebhook(Hashable):
         """
         return self.auth_token is not None
 
+    def _assert_token(self) -> None:
+        if self.token is None:
+            raise InvalidArgument("This webhook does not have a token associated with it")
+
+    def _previous_allowed_mentions(self) -> Optional[AllowedMentions]:
+        state = self._state
+        if isinstance(state, _WebhookState):
+            state = state._parent
+        return state.allowed_mentions if state is not None else None
+
     @property
     def guild(self) -> Optional[Guild]:
         """Optional[:class:`Guild`]: The guild this webhook belongs to.
@@ -1040,7 +1388,7 @@ class Webhook(BaseWebhook):
         .. versionadded:: 2.0
     """
 
-    __slots__: Tuple[str, ...] = ("session",)
+    __slots__: Tuple[str, ...] = ("session", "_url")
 
     def __init__(
         self,
@@ -1052,13 +1400,21 @@ class Webhook(BaseWebhook):
         super().__init__(data, token, state)
         self.session = session
 
+    def _update(self, data: WebhookPayload) -> None:
+        super()._update(data)
+        # the id and token may have changed, rebuild the url on next access
+        self._url: Optional[str] = None
+
     def __repr__(self) -> str:
-        return f"<Webhook id={self.id!r}>"
+        return "<Webhook id=%r>" % (self.id,)
 
     @property
     def url(self) -> str:
         """:class:`str` : Returns the webhook's url."""
-        return f"https://discord.com/api/webhooks/{self.id}/{self.token}"
+        url = self._url
+        if url is None:
+            url = self._url = _WEBHOOK_URL_TEMPLATE % (self.id, self.token)
+        return url
 
     @classmethod
     def partial(
@@ -1131,26 +1487,23 @@ class Webhook(BaseWebhook):
             A partial :class:`Webhook`.
             A partial webhook is just a webhook object with an ID and a token.
         """
-        m = re.search(
-            r"discord(?:app)?.com/api/webhooks/(?P<id>[0-9]{17,20})/(?P<token>[A-Za-z0-9\.\-\_]{60,68})",
-            url,
-        )
+        m = _WEBHOOK_URL_RE.search(url)
         if m is None:
             raise InvalidArgument("Invalid webhook URL given.")
 
-        data: Dict[str, Any] = m.groupdict()
-        data["type"] = 1
+        data: Dict[str, Any] = {"id": m.group("id"), "token": m.group("token"), "type": 1}
         return cls(data, session, token=bot_token)  # type: ignore
 
     @classmethod
     def _as_follower(cls, data, *, channel, user) -> Webhook:
-        name = f"{channel.guild} #{channel}"
+        guild = channel.guild
+        name = "%s #%s" % (guild, channel)
         feed: WebhookPayload = {
             "id": data["webhook_id"],
             "type": 2,
             "name": name,
             "channel_id": channel.id,
-            "guild_id": channel.guild.id,
+            "guild_id": guild.id,
             "user": {
                 "username": user.name,
                 "global_name": user.global_name,
@@ -1161,7 +1514,7 @@ class Webhook(BaseWebhook):
         }
 
         state = channel._state
-        session = channel._state.http._HTTPClient__session
+        session = state.http._HTTPClient__session
         return cls(feed, session=session, state=state, token=state._get_client()._token)
 
     @classmethod
@@ -1204,7 +1557,7 @@ class Webhook(BaseWebhook):
         :class:`Webhook`
             The fetched webhook.
         """
-        adapter = async_context.get()
+        adapter = _get_adapter()
 
         if prefer_auth and self.auth_token:
             data = await adapter.fetch_webhook(self.id, self.auth_token, session=self.session)
@@ -1246,7 +1599,7 @@ class Webhook(BaseWebhook):
         if self.token is None and self.auth_token is None:
             raise InvalidArgument("This webhook does not have a token associated with it")
 
-        adapter = async_context.get()
+        adapter = _get_adapter()
 
         if prefer_auth and self.auth_token:
             await adapter.delete_webhook(
@@ -1307,6 +1660,8 @@ class Webhook(BaseWebhook):
         if self.token is None and self.auth_token is None:
             raise InvalidArgument("This webhook does not have a token associated with it")
 
+        adapter = _get_adapter()
+
         payload: Dict[str, Any] = {}
         if name is not MISSING:
             payload["name"] = str(name) if name is not None else None
@@ -1314,9 +1669,11 @@ class Webhook(BaseWebhook):
         if avatar is not MISSING:
             payload["avatar"] = await utils.obj_to_base64_data(avatar)
 
-        adapter = async_context.get()
+        if not payload and channel is None:
+            # nothing to change, so don't spend a request on it
+            return self
 
-        data: Optional[WebhookPayload] = None
+        data: WebhookPayload
         # If a channel is given, always use the authenticated endpoint
         if channel is not None:
             if self.auth_token is None:
@@ -1326,8 +1683,7 @@ class Webhook(BaseWebhook):
             data = await adapter.edit_webhook(
                 self.id, self.auth_token, payload=payload, session=self.session, reason=reason
             )
-
-        if prefer_auth and self.auth_token:
+        elif prefer_auth and self.auth_token:
             data = await adapter.edit_webhook(
                 self.id, self.auth_token, payload=payload, session=self.session, reason=reason
             )
@@ -1335,9 +1691,8 @@ class Webhook(BaseWebhook):
             data = await adapter.edit_webhook_with_token(
                 self.id, self.token, payload=payload, session=self.session, reason=reason
             )
-
-        if data is None:
-            raise RuntimeError("Unreachable code hit: data was not assigned")
+        else:
+            raise InvalidArgument("This webhook does not have a token associated with it")
 
         return Webhook(data=data, session=self.session, token=self.auth_token, state=self._state)
 
@@ -1526,14 +1881,11 @@ class Webhook(BaseWebhook):
             If ``wait`` is ``True`` then the message that was sent, otherwise ``None``.
         """
 
-        if self.token is None:
-            raise InvalidArgument("This webhook does not have a token associated with it")
+        self._assert_token()
 
-        previous_mentions: Optional[AllowedMentions] = getattr(
-            self._state, "allowed_mentions", None
-        )
+        previous_mentions = self._previous_allowed_mentions()
 
-        application_webhook = self.type is WebhookType.application
+        application_webhook = self._is_application
         if ephemeral and not application_webhook:
             raise InvalidArgument("ephemeral messages can only be sent from application webhooks")
 
@@ -1563,7 +1915,8 @@ class Webhook(BaseWebhook):
             suppress_embeds=suppress_embeds,
             thread_name=thread_name,
         )
-        adapter = async_context.get()
+        thread_id = None if thread is MISSING or thread is None else thread.id
+        adapter = _get_adapter()
 
         data = await adapter.execute_webhook(
             self.id,
@@ -1572,7 +1925,7 @@ class Webhook(BaseWebhook):
             payload=params.payload,
             multipart=params.multipart,
             files=params.files,
-            thread_id=thread.id if thread else None,
+            thread_id=thread_id,
             wait=wait,
         )
 
@@ -1618,10 +1971,9 @@ class Webhook(BaseWebhook):
             The message asked for.
         """
 
-        if self.token is None:
-            raise InvalidArgument("This webhook does not have a token associated with it")
+        self._assert_token()
 
-        adapter = async_context.get()
+        adapter = _get_adapter()
         data = await adapter.get_webhook_message(
             self.id,
             self.token,
@@ -1714,8 +2066,7 @@ class Webhook(BaseWebhook):
             The newly edited webhook message.
         """
 
-        if self.token is None:
-            raise InvalidArgument("This webhook does not have a token associated with it")
+        self._assert_token()
 
         if view is not MISSING:
             if isinstance(self._state, _WebhookState):
@@ -1723,9 +2074,7 @@ class Webhook(BaseWebhook):
 
             self._state.prevent_view_updates_for(message_id)
 
-        previous_mentions: Optional[AllowedMentions] = getattr(
-            self._state, "allowed_mentions", None
-        )
+        previous_mentions = self._previous_allowed_mentions()
         params = handle_message_parameters(
             content=content,
             file=file,
@@ -1737,7 +2086,7 @@ class Webhook(BaseWebhook):
             allowed_mentions=allowed_mentions,
             previous_allowed_mentions=previous_mentions,
         )
-        adapter = async_context.get()
+        adapter = _get_adapter()
         thread_id: Optional[int] = None
         if thread is not MISSING:
             thread_id = thread.id
@@ -1780,10 +2129,9 @@ class Webhook(BaseWebhook):
         Forbidden
             Deleted a message that is not yours.
         """
-        if self.token is None:
-            raise InvalidArgument("This webhook does not have a token associated with it")
+        self._assert_token()
 
-        adapter = async_context.get()
+        adapter = _get_adapter()
         await adapter.delete_webhook_message(
             self.id,
             self.token,
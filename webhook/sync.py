@@ -10,11 +10,11 @@ from __future__ import annotations
 
 import contextlib
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
 import logging
-import re
 import threading
 import time
-from types import TracebackType
+from types import ModuleType, TracebackType
 from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple, Type, Union, overload
 from urllib.parse import quote as urlquote
 from weakref import WeakValueDictionary
@@ -24,7 +24,14 @@ from ..channel import PartialMessageable
 from ..errors import DiscordServerError, Forbidden, HTTPException, InvalidArgument, NotFound
 from ..http import _USER_AGENT, Route
 from ..message import Attachment, Message
-from .async_ import BaseWebhook, _WebhookState, handle_message_parameters
+from .async_ import (
+    BaseWebhook,
+    ExecuteWebhookParameters,
+    _WEBHOOK_URL_RE,
+    _WEBHOOK_URL_TEMPLATE,
+    _WebhookState,
+    handle_message_parameters,
+)
 
 __all__ = (
     "SyncWebhook",
@@ -44,9 +51,66 @@ if TYPE_CHECKING:
     with contextlib.suppress(ModuleNotFoundError):
         from requests import Response, Session
 
+try:
+    import httpx
+except ModuleNotFoundError:
+    _has_httpx = False
+else:
+    _has_httpx = True
+
+# httpx connection failures don't derive from OSError. Only errors where the connection
+# itself failed are retried, like errno 54/10054 resets; a timeout may come after Discord
+# already accepted the request, so retrying it could post a message twice.
+# An empty tuple makes the except clause in WebhookAdapter.request match nothing.
+_HTTPX_CONNECTION_ERRORS: Tuple[Type[BaseException], ...] = (
+    (httpx.ConnectError, httpx.RemoteProtocolError, httpx.ReadError, httpx.WriteError)
+    if _has_httpx
+    else ()
+)
+
+# seconds, the shared httpx client doesn't wait forever like bare ``requests`` calls
+_HTTPX_TIMEOUT = 30.0
+
 
 MISSING = utils.MISSING
 
+# used by SyncWebhook.send_nowait, threads are only started once work is submitted
+_webhook_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="nexon-wh")
+
+_httpx_client: Optional[httpx.Client] = None
+_httpx_client_lock = threading.Lock()
+
+
+def _get_httpx_client() -> Optional[httpx.Client]:
+    global _httpx_client
+
+    if not _has_httpx:
+        return None
+
+    if _httpx_client is None:
+        with _httpx_client_lock:
+            if _httpx_client is None:
+                limits = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+                try:
+                    _httpx_client = httpx.Client(
+                        http2=True, timeout=_HTTPX_TIMEOUT, limits=limits
+                    )
+                except ImportError:
+                    # HTTP/2 support requires the optional h2 package
+                    _httpx_client = httpx.Client(timeout=_HTTPX_TIMEOUT, limits=limits)
+    return _httpx_client
+
+
+def _message_session(session: Session) -> Any:
+    # Webhooks created without an explicit session use the ``requests`` module
+    # itself. Message traffic for those is sent through a shared httpx client
+    # instead so that requests to Discord can share a single connection.
+    if isinstance(session, ModuleType):
+        client = _get_httpx_client()
+        if client is not None:
+            return client
+    return session
+
 
 class DeferredLock:
     def __init__(self, lock: threading.Lock) -> None:
@@ -78,6 +142,32 @@ class WebhookAdapter:
             threading.Lock,
         ] = WeakValueDictionary()
 
+    def _send(
+        self,
+        session: Any,
+        method: str,
+        url: str,
+        *,
+        data: Optional[Union[str, Dict[str, Any]]],
+        files: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]],
+    ) -> Any:
+        if not _has_httpx or not isinstance(session, httpx.Client):
+            return session.request(
+                method, url, data=data, files=files, headers=headers, params=params
+            )
+
+        if isinstance(data, str):
+            response = session.request(method, url, content=data, headers=headers, params=params)
+        else:
+            response = session.request(
+                method, url, data=data, files=files or None, headers=headers, params=params
+            )
+        # Compatibility with requests
+        response.reason = response.reason_phrase  # type: ignore
+        return response
+
     def request(
         self,
         route: Route,
@@ -133,8 +223,16 @@ class WebhookAdapter:
                             file_data[name] = (p["filename"], p["value"], p["content_type"])
 
                 try:
-                    with session.request(
-                        method, url, data=to_send, files=file_data, headers=headers, params=params
+                    with contextlib.closing(
+                        self._send(
+                            session,
+                            method,
+                            url,
+                            data=to_send,
+                            files=file_data,
+                            headers=headers,
+                            params=params,
+                        )
                     ) as response:
                         _log.debug(
                             "Webhook ID %s with %s %s has returned status code %s",
@@ -194,6 +292,11 @@ class WebhookAdapter:
                         time.sleep(1 + attempt * 2)
                         continue
                     raise
+                except _HTTPX_CONNECTION_ERRORS:
+                    if attempt < 4:
+                        time.sleep(1 + attempt * 2)
+                        continue
+                    raise
 
             if response:
                 if response.status_code >= 500:
@@ -280,7 +383,12 @@ class WebhookAdapter:
             webhook_token=token,
         )
         return self.request(
-            route, session, payload=payload, multipart=multipart, files=files, params=params
+            route,
+            _message_session(session),
+            payload=payload,
+            multipart=multipart,
+            files=files,
+            params=params,
         )
 
     def get_webhook_message(
@@ -298,7 +406,7 @@ class WebhookAdapter:
             webhook_token=token,
             message_id=message_id,
         )
-        return self.request(route, session)
+        return self.request(route, _message_session(session))
 
     def edit_webhook_message(
         self,
@@ -323,7 +431,12 @@ class WebhookAdapter:
             message_id=message_id,
         )
         return self.request(
-            route, session, payload=payload, multipart=multipart, files=files, params=params
+            route,
+            _message_session(session),
+            payload=payload,
+            multipart=multipart,
+            files=files,
+            params=params,
         )
 
     def delete_webhook_message(
@@ -341,7 +454,7 @@ class WebhookAdapter:
             webhook_token=token,
             message_id=message_id,
         )
-        return self.request(route, session)
+        return self.request(route, _message_session(session))
 
     def fetch_webhook(
         self,
@@ -394,6 +507,8 @@ class SyncWebhookMessage(Message):
     .. versionadded:: 2.0
     """
 
+    __slots__ = ()
+
     _state: _WebhookState
 
     def edit(
@@ -547,12 +662,12 @@ class SyncWebhook(BaseWebhook):
         self.session = session
 
     def __repr__(self) -> str:
-        return f"<Webhook id={self.id!r}>"
+        return "<Webhook id=%r>" % (self.id,)
 
     @property
     def url(self) -> str:
         """:class:`str` : Returns the webhook's url."""
-        return f"https://discord.com/api/webhooks/{self.id}/{self.token}"
+        return _WEBHOOK_URL_TEMPLATE % (self.id, self.token)
 
     @classmethod
     def partial(
@@ -570,7 +685,11 @@ class SyncWebhook(BaseWebhook):
             The session to use to send requests with. Note
             that the library does not manage the session and
             will not close it. If not given, the ``requests``
-            auto session creation functions are used instead.
+            auto session creation functions are used instead,
+            and messages are sent through a shared ``httpx`` client
+            if ``httpx`` is installed. Requests sent through that client
+            time out after 30 seconds, and network failures raise
+            ``httpx`` exceptions instead of ``requests.exceptions``.
         bot_token: Optional[:class:`str`]
             The bot authentication token for authenticated requests
             involving the webhook.
@@ -609,7 +728,11 @@ class SyncWebhook(BaseWebhook):
             The session to use to send requests with. Note
             that the library does not manage the session and
             will not close it. If not given, the ``requests``
-            auto session creation functions are used instead.
+            auto session creation functions are used instead,
+            and messages are sent through a shared ``httpx`` client
+            if ``httpx`` is installed. Requests sent through that client
+            time out after 30 seconds, and network failures raise
+            ``httpx`` exceptions instead of ``requests.exceptions``.
         bot_token: Optional[:class:`str`]
             The bot authentication token for authenticated requests
             involving the webhook.
@@ -625,15 +748,11 @@ class SyncWebhook(BaseWebhook):
             A partial :class:`Webhook`.
             A partial webhook is just a webhook object with an ID and a token.
         """
-        m = re.search(
-            r"discord(?:app)?.com/api/webhooks/(?P<id>[0-9]{17,20})/(?P<token>[A-Za-z0-9\.\-\_]{60,68})",
-            url,
-        )
+        m = _WEBHOOK_URL_RE.search(url)
         if m is None:
             raise InvalidArgument("Invalid webhook URL given.")
 
-        data: Dict[str, Any] = m.groupdict()
-        data["type"] = 1
+        data: Dict[str, Any] = {"id": m.group("id"), "token": m.group("token"), "type": 1}
         import requests
 
         if session is not MISSING:
@@ -943,12 +1062,40 @@ class SyncWebhook(BaseWebhook):
             If ``wait`` is ``True`` then the message that was sent, otherwise ``None``.
         """
 
-        if self.token is None:
-            raise InvalidArgument("This webhook does not have a token associated with it")
-
-        previous_mentions: Optional[AllowedMentions] = getattr(
-            self._state, "allowed_mentions", None
+        params, thread_id = self._prepare_send(
+            content,
+            username=username,
+            avatar_url=avatar_url,
+            tts=tts,
+            file=file,
+            files=files,
+            embed=embed,
+            embeds=embeds,
+            allowed_mentions=allowed_mentions,
+            thread=thread,
+            thread_name=thread_name,
         )
+        return self._execute(params, thread_id, wait)
+
+    def _prepare_send(
+        self,
+        content: str,
+        *,
+        username: str,
+        avatar_url: Any,
+        tts: bool,
+        file: File,
+        files: List[File],
+        embed: Embed,
+        embeds: List[Embed],
+        allowed_mentions: AllowedMentions,
+        thread: Snowflake,
+        thread_name: Optional[str],
+    ) -> Tuple[ExecuteWebhookParameters, Optional[int]]:
+        # shared by send and send_nowait so that both validate the same way
+        self._assert_token()
+
+        previous_mentions = self._previous_allowed_mentions()
 
         params = handle_message_parameters(
             content=content,
@@ -963,22 +1110,87 @@ class SyncWebhook(BaseWebhook):
             previous_allowed_mentions=previous_mentions,
             thread_name=thread_name,
         )
+        thread_id = None if thread is MISSING or thread is None else thread.id
+        return params, thread_id
+
+    def _execute(
+        self, params: ExecuteWebhookParameters, thread_id: Optional[int], wait: bool
+    ) -> Optional[SyncWebhookMessage]:
         adapter: WebhookAdapter = _get_webhook_adapter()
 
         data = adapter.execute_webhook(
             self.id,
-            self.token,
+            self.token,  # type: ignore
             session=self.session,
             payload=params.payload,
             multipart=params.multipart,
             files=params.files,
-            thread_id=thread.id if thread else None,
+            thread_id=thread_id,
             wait=wait,
         )
         if wait:
             return self._create_message(data)
         return None
 
+    def send_nowait(
+        self,
+        content: str = MISSING,
+        *,
+        username: str = MISSING,
+        avatar_url: Any = MISSING,
+        tts: bool = False,
+        file: File = MISSING,
+        files: List[File] = MISSING,
+        embed: Embed = MISSING,
+        embeds: List[Embed] = MISSING,
+        allowed_mentions: AllowedMentions = MISSING,
+        thread: Snowflake = MISSING,
+        thread_name: Optional[str] = None,
+    ) -> Future[None]:
+        """Sends a message using the webhook without blocking the calling thread.
+
+        This takes the same parameters as :meth:`send` except ``wait``. The
+        parameters are validated immediately, the request itself is performed
+        on a shared pool of worker threads.
+
+        .. versionadded:: Nexon 0.3.2
+
+        .. note::
+
+            :class:`File` objects are read later on a pool thread, not during
+            this call. Don't close them until the returned future is done.
+
+        Raises
+        ------
+        InvalidArgument
+            You specified both ``embed`` and ``embeds`` or ``file`` and ``files``,
+            or there was no token associated with this webhook.
+        ValueError
+            The length of ``embeds`` was invalid.
+
+        Returns
+        -------
+        :class:`concurrent.futures.Future`
+            A future that resolves to ``None`` once the message was sent. If
+            sending failed, the exception (e.g. :exc:`HTTPException`) is set
+            on the future so it can be inspected or retried.
+        """
+
+        params, thread_id = self._prepare_send(
+            content,
+            username=username,
+            avatar_url=avatar_url,
+            tts=tts,
+            file=file,
+            files=files,
+            embed=embed,
+            embeds=embeds,
+            allowed_mentions=allowed_mentions,
+            thread=thread,
+            thread_name=thread_name,
+        )
+        return _webhook_pool.submit(self._execute, params, thread_id, False)
+
     def fetch_message(self, id: int, /) -> SyncWebhookMessage:
         """Retrieves a single :class:`~nexon.SyncWebhookMessage` owned by this webhook.
 
@@ -1006,8 +1218,7 @@ class SyncWebhook(BaseWebhook):
             The message asked for.
         """
 
-        if self.token is None:
-            raise InvalidArgument("This webhook does not have a token associated with it")
+        self._assert_token()
 
         adapter: WebhookAdapter = _get_webhook_adapter()
         data = adapter.get_webhook_message(
@@ -1078,12 +1289,9 @@ class SyncWebhook(BaseWebhook):
             There was no token associated with this webhook.
         """
 
-        if self.token is None:
-            raise InvalidArgument("This webhook does not have a token associated with it")
+        self._assert_token()
 
-        previous_mentions: Optional[AllowedMentions] = getattr(
-            self._state, "allowed_mentions", None
-        )
+        previous_mentions = self._previous_allowed_mentions()
         params = handle_message_parameters(
             content=content,
             file=file,
@@ -1130,8 +1338,7 @@ class SyncWebhook(BaseWebhook):
         Forbidden
             Deleted a message that is not yours.
         """
-        if self.token is None:
-            raise InvalidArgument("This webhook does not have a token associated with it")
+        self._assert_token()
 
         adapter: WebhookAdapter = _get_webhook_adapter()
         adapter.delete_webhook_message(
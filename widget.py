@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 from .activity import BaseActivity, Spotify, create_activity
 from .enums import Status, try_enum
 from .invite import Invite
+from .mixins import Hashable
 from .user import BaseUser
 from .utils import get_as_snowflake, resolve_invite, snowflake_time
 
@@ -22,8 +23,10 @@ __all__ = (
     "Widget",
 )
 
+_STATUS_BY_VALUE: Dict[str, Status] = {status.value: status for status in Status}
 
-class WidgetChannel:
+
+class WidgetChannel(Hashable):
     """Represents a "partial" widget channel.
 
     .. container:: operations
@@ -150,11 +153,14 @@ class WidgetMember(BaseUser):
     ) -> None:
         super().__init__(state=state, data=data)
         self.nick: Optional[str] = data.get("nick")
-        self.status: Status = try_enum(Status, data.get("status"))
-        self.deafened: Optional[bool] = data.get("deaf", False) or data.get("self_deaf", False)
-        self.muted: Optional[bool] = data.get("mute", False) or data.get("self_mute", False)
+        status = data.get("status")
+        # unknown values still go through try_enum to get the usual proxy
+        self.status: Status = _STATUS_BY_VALUE.get(status) or try_enum(Status, status)
+        self.deafened: Optional[bool] = data.get("deaf") or data.get("self_deaf", False)
+        self.muted: Optional[bool] = data.get("mute") or data.get("self_mute", False)
         self.suppress: Optional[bool] = data.get("suppress", False)
-        self.activity = create_activity(state, data["game"]) if "game" in data else None
+        # create_activity already maps a missing or empty game to None
+        self.activity = create_activity(state, data.get("game"))
 
         self.connected_channel: Optional[WidgetChannel] = connected_channel
 
@@ -177,7 +183,7 @@ class WidgetMember(BaseUser):
         return self.nick or self.global_name or self.name
 
 
-class Widget:
+class Widget(Hashable):
     """Represents a :class:`Guild` widget.
 
     .. container:: operations
@@ -190,6 +196,10 @@ class Widget:
 
             Checks if two widgets are not the same.
 
+        .. describe:: hash(x)
+
+            Returns the widget's hash.
+
         .. describe:: str(x)
 
             Returns the widget's JSON URL.
@@ -200,55 +210,38 @@ class Widget:
         The guild's ID.
     name: :class:`str`
         The guild's name.
-    channels: List[:class:`WidgetChannel`]
-        The accessible voice channels in the guild.
-    members: List[:class:`Member`]
-        The online members in the server. Offline members
-        do not appear in the widget.
-
-        .. note::
-
-            Due to a Discord limitation, if this data is available
-            the users will be "anonymized" with linear IDs and discriminator
-            information being incorrect. Likewise, the number of members
-            retrieved is capped.
-
     """
 
-    __slots__ = ("_state", "channels", "_invite", "id", "members", "name")
+    __slots__ = (
+        "_state",
+        "_channels",
+        "_channels_by_id",
+        "_invite",
+        "id",
+        "_members",
+        "name",
+        "_json_url",
+        "_raw_channels",
+        "_raw_members",
+    )
 
     def __init__(self, *, state: ConnectionState, data: WidgetPayload) -> None:
         self._state = state
         self._invite = data["instant_invite"]
         self.name: str = data["name"]
         self.id: int = int(data["id"])
+        self._json_url: str = f"https://discord.com/api/guilds/{self.id}/widget.json"
 
-        self.channels: List[WidgetChannel] = []
-        for channel in data.get("channels", []):
-            _id = int(channel["id"])
-            self.channels.append(
-                WidgetChannel(id=_id, name=channel["name"], position=channel["position"])
-            )
-
-        self.members: List[WidgetMember] = []
-        channels = {channel.id: channel for channel in self.channels}
-        for member in data.get("members", []):
-            connected_channel = get_as_snowflake(member, "channel_id")
-            if connected_channel in channels:
-                connected_channel = channels[connected_channel]
-            elif connected_channel:
-                connected_channel = WidgetChannel(id=connected_channel, name="", position=0)
-
-            self.members.append(WidgetMember(state=self._state, data=member, connected_channel=connected_channel))  # type: ignore
+        # channels and members are only built when first accessed
+        self._raw_channels = data.get("channels", [])
+        self._raw_members = data.get("members", [])
+        self._channels: Optional[List[WidgetChannel]] = None
+        self._channels_by_id: Dict[int, WidgetChannel] = {}
+        self._members: Optional[List[WidgetMember]] = None
 
     def __str__(self) -> str:
         return self.json_url
 
-    def __eq__(self, other: Any) -> bool:
-        if isinstance(other, Widget):
-            return self.id == other.id
-        return False
-
     def __repr__(self) -> str:
         return f"<Widget id={self.id} name={self.name!r} invite_url={self.invite_url!r}>"
 
@@ -257,10 +250,75 @@ class Widget:
         """:class:`datetime.datetime`: Returns the member's creation time in UTC."""
         return snowflake_time(self.id)
 
+    def _load_channels(self) -> List[WidgetChannel]:
+        channels: List[WidgetChannel] = []
+        channels_by_id = self._channels_by_id
+        for channel in self._raw_channels:
+            _id = int(channel["id"])
+            widget_channel = WidgetChannel(
+                id=_id, name=channel["name"], position=channel["position"]
+            )
+            channels.append(widget_channel)
+            channels_by_id[_id] = widget_channel
+
+        self._channels = channels
+        self._raw_channels = []
+        return channels
+
+    @property
+    def channels(self) -> List[WidgetChannel]:
+        """List[:class:`WidgetChannel`]: The accessible voice channels in the guild."""
+        channels = self._channels
+        if channels is None:
+            channels = self._load_channels()
+        return channels
+
+    @property
+    def members(self) -> List[WidgetMember]:
+        """List[:class:`WidgetMember`]: The online members in the server. Offline members
+        do not appear in the widget.
+
+        .. note::
+
+            Due to a Discord limitation, if this data is available
+            the users will be "anonymized" with linear IDs and discriminator
+            information being incorrect. Likewise, the number of members
+            retrieved is capped.
+        """
+        if self._members is None:
+            if self._channels is None:
+                self._load_channels()
+            channels = self._channels_by_id
+
+            def resolve_channel(channel_id: Optional[int]) -> Optional[WidgetChannel]:
+                if channel_id is None:
+                    return None
+                connected_channel = channels.get(channel_id)
+                if connected_channel is None:
+                    # not listed in the widget; share one placeholder per channel id
+                    connected_channel = WidgetChannel(id=channel_id, name="", position=0)
+                    channels[channel_id] = connected_channel
+                return connected_channel
+
+            state = self._state
+            # local aliases keep the per-member loop on LOAD_FAST
+            widget_member = WidgetMember
+            snowflake = get_as_snowflake
+            self._members = [
+                widget_member(
+                    state=state,
+                    data=member,
+                    connected_channel=resolve_channel(snowflake(member, "channel_id")),
+                )
+                for member in self._raw_members
+            ]
+            self._raw_members = []
+        return self._members
+
     @property
     def json_url(self) -> str:
         """:class:`str`: The JSON URL of the widget."""
-        return f"https://discord.com/api/guilds/{self.id}/widget.json"
+        return self._json_url
 
     @property
     def invite_url(self) -> str: